@@ -13,6 +13,22 @@ from moviepy.editor import VideoClip, ColorClip, CompositeVideoClip
 from config import VIDEO_WIDTH, VIDEO_HEIGHT, TEMP_DIR, FPS
 
 
+# Vertical position of each row as a 0..1 ratio (shared by the gradient styles)
+_ROW_RATIO = np.arange(VIDEO_HEIGHT) / VIDEO_HEIGHT
+
+
+def _linear_rows(color1, color2, ratio: np.ndarray) -> np.ndarray:
+    """Per-row color1 -> color2 blend, shape (H, 3) float64"""
+    ratio = ratio[:, None]
+    return np.asarray(color1, dtype=np.float64) * (1 - ratio) + np.asarray(color2, dtype=np.float64) * ratio
+
+
+def _fill_rows(rows: np.ndarray, dtype=np.uint8) -> np.ndarray:
+    """Expand (H, 3) row colors into a contiguous (H, W, 3) frame in one broadcast copy"""
+    rows = rows.astype(dtype)
+    return np.broadcast_to(rows[:, None, :], (rows.shape[0], VIDEO_WIDTH, 3)).copy()
+
+
 class AnimatedBackgroundGenerator:
     """Generates animated video backgrounds programmatically"""
     
@@ -68,43 +84,23 @@ class AnimatedBackgroundGenerator:
         color1, color2, color3 = self._get_color_palette()
         
         def make_frame(t):
-            # Create flowing gradient
-            img = np.zeros((VIDEO_HEIGHT, VIDEO_WIDTH, 3), dtype=np.uint8)
-            
             # Animated wave offset
             wave_speed = 0.5
             wave_offset = t * wave_speed
             
-            for y in range(VIDEO_HEIGHT):
-                # Base gradient ratio
-                base_ratio = y / VIDEO_HEIGHT
-                
-                # Add flowing wave effect
-                wave = 0.1 * math.sin(base_ratio * 4 + wave_offset * 2)
-                wave += 0.05 * math.sin(base_ratio * 8 + wave_offset * 3)
-                
-                ratio = base_ratio + wave
-                ratio = max(0, min(1, ratio))
-                
-                # Interpolate between colors
-                if ratio < 0.5:
-                    r = ratio * 2
-                    c = (
-                        int(color1[0] * (1 - r) + color2[0] * r),
-                        int(color1[1] * (1 - r) + color2[1] * r),
-                        int(color1[2] * (1 - r) + color2[2] * r),
-                    )
-                else:
-                    r = (ratio - 0.5) * 2
-                    c = (
-                        int(color2[0] * (1 - r) + color3[0] * r),
-                        int(color2[1] * (1 - r) + color3[1] * r),
-                        int(color2[2] * (1 - r) + color3[2] * r),
-                    )
-                
-                img[y, :] = c
+            # Add flowing wave effect to the base gradient ratio
+            wave = 0.1 * np.sin(_ROW_RATIO * 4 + wave_offset * 2)
+            wave += 0.05 * np.sin(_ROW_RATIO * 8 + wave_offset * 3)
+            ratio = np.clip(_ROW_RATIO + wave, 0, 1)
             
-            return img
+            # Interpolate color1 -> color2 over the top half, color2 -> color3 below
+            lower = ratio < 0.5
+            rows = np.where(
+                lower[:, None],
+                _linear_rows(color1, color2, ratio * 2),
+                _linear_rows(color2, color3, (ratio - 0.5) * 2),
+            )
+            return _fill_rows(rows)
         
         return VideoClip(make_frame, duration=duration).set_fps(FPS)
     
@@ -166,17 +162,11 @@ class AnimatedBackgroundGenerator:
                 'alpha': random.uniform(0.3, 0.8),
             })
         
+        # Gradient base doesn't change over time: build it once, copy per frame
+        base = _fill_rows(_linear_rows(color1, color2, _ROW_RATIO), dtype=np.float32)
+        
         def make_frame(t):
-            # Create gradient base
-            img = np.zeros((VIDEO_HEIGHT, VIDEO_WIDTH, 3), dtype=np.float32)
-            
-            for y in range(VIDEO_HEIGHT):
-                ratio = y / VIDEO_HEIGHT
-                img[y, :] = [
-                    color1[0] * (1 - ratio) + color2[0] * ratio,
-                    color1[1] * (1 - ratio) + color2[1] * ratio,
-                    color1[2] * (1 - ratio) + color2[2] * ratio,
-                ]
+            img = base.copy()
             
             # Draw particles
             for p in particles:
@@ -273,20 +263,13 @@ class AnimatedBackgroundGenerator:
         
         shape_colors = [color1, color2, color3]
         
+        # Gradient base doesn't change over time: build it once, copy per frame
+        base_img = Image.fromarray(_fill_rows(_linear_rows(color1, color2, _ROW_RATIO)))
+        
         def make_frame(t):
-            # Gradient base
-            img = Image.new('RGB', (VIDEO_WIDTH, VIDEO_HEIGHT))
+            img = base_img.copy()
             draw = ImageDraw.Draw(img)
             
-            for y in range(VIDEO_HEIGHT):
-                ratio = y / VIDEO_HEIGHT
-                c = (
-                    int(color1[0] * (1 - ratio) + color2[0] * ratio),
-                    int(color1[1] * (1 - ratio) + color2[1] * ratio),
-                    int(color1[2] * (1 - ratio) + color2[2] * ratio),
-                )
-                draw.line([(0, y), (VIDEO_WIDTH, y)], fill=c)
-            
             # Draw shapes
             for s in shapes:
                 px = (s['x'] + s['speed_x'] * t) % VIDEO_WIDTH
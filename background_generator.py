@@ -67,25 +67,23 @@ class BackgroundGenerator:
     
     def _create_gradient(self, index: int) -> Image.Image:
         """Create vertical/diagonal gradient"""
-        img = Image.new('RGB', (VIDEO_WIDTH, VIDEO_HEIGHT))
-        draw = ImageDraw.Draw(img)
-        
         color1, color2 = self._get_color_palette(index)
         
         # Add slight diagonal variation
         angle = random.uniform(-0.2, 0.2)
         
-        for y in range(VIDEO_HEIGHT):
-            ratio = y / VIDEO_HEIGHT
-            # Add some noise for texture
-            noise = random.uniform(-0.02, 0.02)
-            ratio = max(0, min(1, ratio + noise))
-            
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            
-            draw.line([(0, y), (VIDEO_WIDTH, y)], fill=(r, g, b))
+        # Per-row ratio with some noise for texture
+        ratio = np.arange(VIDEO_HEIGHT) / VIDEO_HEIGHT
+        ratio = np.clip(ratio + np.random.uniform(-0.02, 0.02, VIDEO_HEIGHT), 0, 1)[:, None]
+        rows = (
+            np.asarray(color1, dtype=np.float64) * (1 - ratio)
+            + np.asarray(color2, dtype=np.float64) * ratio
+        ).astype(np.uint8)
+        
+        # Expand rows to the full frame in one broadcast copy
+        img = Image.fromarray(
+            np.broadcast_to(rows[:, None, :], (VIDEO_HEIGHT, VIDEO_WIDTH, 3)).copy()
+        )
         
         # Add subtle vignette
         img = self._add_vignette(img)
@@ -3,13 +3,22 @@ YouTube Shorts Video Generator - Gradio App for Hugging Face Spaces
 """
 
 import os
+import io
+import time
 import uuid
+import queue
+import random
+import asyncio
 import tempfile
 import shutil
 import threading
+import contextvars
+import functools
+import hashlib
 import json
-import base64
-import requests
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Load environment variables (optional - for local development)
@@ -21,58 +30,100 @@ except ImportError:
 
 import gradio as gr
 
+# pybase64 is a drop-in, SIMD-accelerated replacement for the stdlib codec
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+# orjson parses API responses straight from bytes; json.loads accepts bytes too
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Set up paths before imports
 TEMP_DIR = tempfile.gettempdir() + "/videogen_temp"
 OUTPUT_DIR = tempfile.gettempdir() + "/videogen_output"
 os.environ.setdefault("TEMP_DIR", TEMP_DIR)
 os.environ.setdefault("OUTPUT_DIR", OUTPUT_DIR)
 
-# Global cancellation flag - shared across all requests
-_cancel_flag = threading.Event()
-_current_job_id = None
+# Per-job cancellation tokens. Each generate_video call registers its own token
+# (visible to its thread via a ContextVar); Cancel flags every running job.
+class _Job:
+    """Cancellation token for a single generation job"""
+    __slots__ = ("cancelled",)
+
+    def __init__(self):
+        self.cancelled = False
+
+
+_current_job = contextvars.ContextVar("videogen_job", default=None)
+_active_jobs = set()
 _job_lock = threading.Lock()
 
 def request_cancel():
-    """Request cancellation of current job"""
-    global _cancel_flag
-    _cancel_flag.set()
+    """Request cancellation of running jobs"""
+    with _job_lock:
+        for job in _active_jobs:
+            job.cancelled = True
     print("[App] Cancellation requested!")
     return " Cancellation requested. Please wait..."
 
 def is_cancelled():
-    """Check if cancellation was requested"""
-    return _cancel_flag.is_set()
-
-def reset_cancel():
-    """Reset cancellation flag for new job"""
-    global _cancel_flag
-    _cancel_flag.clear()
+    """Check if cancellation was requested for the current job"""
+    job = _current_job.get()
+    return job is not None and job.cancelled
+
+def start_job() -> _Job:
+    """Register a fresh cancellation token for the current job"""
+    job = _Job()
+    _current_job.set(job)
+    with _job_lock:
+        _active_jobs.add(job)
+    return job
+
+def finish_job(job: _Job):
+    """Unregister a finished job's cancellation token"""
+    with _job_lock:
+        _active_jobs.discard(job)
 
 # Clean up stale temp files on startup
 def cleanup_stale_files():
     """Clean up any stale temp files from previous runs"""
     try:
-        temp_path = Path(TEMP_DIR)
-        if temp_path.exists():
-            for f in temp_path.glob("*"):
+        # Empty TEMP_DIR in place (it may be a mounted volume we can't remove)
+        os.makedirs(TEMP_DIR, exist_ok=True)
+        with os.scandir(TEMP_DIR) as entries:
+            for entry in entries:
                 try:
-                    if f.is_file():
-                        f.unlink()
-                    elif f.is_dir():
-                        shutil.rmtree(f)
-                except Exception:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                except OSError:
                     pass
-            print("[Startup] Cleaned up stale temp files")
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        print("[Startup] Cleaned up stale temp files")
     except Exception as e:
         print(f"[Startup] Cleanup error: {e}")
 
 cleanup_stale_files()
 
-from script_parser import parse_script, get_full_narration_text
-from video_generator import VideoGenerator
-from stock_video_fetcher import StockVideoFetcher
-from audio_generator import AudioGenerator, EDGE_TTS_VOICES
-from translator import Translator
+from script_parser import parse_script
+
+# video_generator/audio_generator pull in moviepy and ffmpeg; they are imported
+# lazily on first use so the UI can come up before the heavy stack loads.
+_EDGE_TTS_VOICES = None
+
+
+def _edge_voices() -> dict:
+    """Return audio_generator.EDGE_TTS_VOICES, importing it on first use"""
+    global _EDGE_TTS_VOICES
+    if _EDGE_TTS_VOICES is None:
+        from audio_generator import EDGE_TTS_VOICES
+        _EDGE_TTS_VOICES = EDGE_TTS_VOICES
+    return _EDGE_TTS_VOICES
 
 # Get API keys from environment (set in HF Spaces secrets)
 PEXELS_API_KEY = os.environ.get("PEXELS_API_KEY", "")
@@ -84,6 +135,33 @@ GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
 # Groq API (for script generation)
 GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 
+# Shared keep-alive session for the Groq/Gemini script-generation calls
+_api_session = None
+_api_session_lock = threading.Lock()
+
+
+def _get_api_session():
+    """Return a pooled requests.Session that retries transient 5xx errors"""
+    global _api_session
+    with _api_session_lock:
+        if _api_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retry = Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=frozenset({"POST"}),
+                raise_on_status=False,
+            )
+            session = requests.Session()
+            session.headers.update({"Content-Type": "application/json"})
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry))
+            _api_session = session
+    return _api_session
+
 # Topic presets for one-click script generation
 TOPIC_PRESETS = [
     {
@@ -113,6 +191,8 @@ TOPIC_PRESETS = [
     }
 ]
 
+TOPIC_PRESETS_BY_LABEL = {p["label"]: p for p in TOPIC_PRESETS}
+
 # YouTube credentials directory
 YOUTUBE_CREDS_DIR = Path(__file__).parent / ".youtube_creds"
 
@@ -141,28 +221,70 @@ _yt_service = None
 _yt_account_name = None
 
 
+# (creds dir mtime_ns, account names) from the last directory scan
+_yt_accounts_cache = None
+
+
+def _saved_youtube_accounts() -> list:
+    """Account names in .youtube_creds/, rescanned only when the dir's mtime changes"""
+    global _yt_accounts_cache
+    try:
+        mtime = YOUTUBE_CREDS_DIR.stat().st_mtime_ns
+    except OSError:
+        return []
+    if _yt_accounts_cache is None or _yt_accounts_cache[0] != mtime:
+        _yt_accounts_cache = (mtime, [f.stem for f in YOUTUBE_CREDS_DIR.glob("*.json")])
+    return list(_yt_accounts_cache[1])
+
+
 def get_youtube_accounts() -> list:
     """List available YouTube accounts from .youtube_creds/ or env"""
-    accounts = []
-    if YOUTUBE_CREDS_DIR.exists():
-        accounts.extend([f.stem for f in YOUTUBE_CREDS_DIR.glob("*.json")])
+    accounts = _saved_youtube_accounts()
     if YOUTUBE_OAUTH_CREDENTIALS_JSON or YOUTUBE_OAUTH_CREDENTIALS_B64:
         accounts.insert(0, "env")
     return accounts
 
 
+@functools.lru_cache(maxsize=1)
 def _load_env_credentials() -> str:
-    """Return OAuth credentials JSON string from env, if present"""
+    """Return OAuth credentials JSON string from env, if present (decoded once)"""
     if YOUTUBE_OAUTH_CREDENTIALS_JSON:
         return YOUTUBE_OAUTH_CREDENTIALS_JSON
     if YOUTUBE_OAUTH_CREDENTIALS_B64:
         try:
-            return base64.b64decode(YOUTUBE_OAUTH_CREDENTIALS_B64).decode("utf-8")
+            return _b64.b64decode(YOUTUBE_OAUTH_CREDENTIALS_B64, validate=False).decode("utf-8")
         except Exception:
             return ""
     return ""
 
 
+def _write_credentials_atomic(creds_file: Path, creds_json: str):
+    """Write credentials via tmp file + rename so a crash never leaves a torn file"""
+    try:
+        tmp = creds_file.with_suffix(".json.tmp")
+        tmp.write_text(creds_json)
+        os.replace(tmp, creds_file)
+    except OSError as e:
+        print(f"[YouTube] Could not save refreshed token: {e}")
+
+
+@functools.lru_cache(maxsize=1)
+def _youtube_discovery_doc():
+    """YouTube v3 discovery document bundled with google-api-python-client (read once)"""
+    from googleapiclient.discovery_cache import get_static_doc
+    return get_static_doc("youtube", "v3")
+
+
+def _build_youtube_service(credentials):
+    """Build the YouTube client without fetching the discovery document over HTTPS"""
+    from googleapiclient.discovery import build, build_from_document
+
+    doc = _youtube_discovery_doc()
+    if doc:
+        return build_from_document(doc, credentials=credentials)
+    return build('youtube', 'v3', credentials=credentials, static_discovery=True)
+
+
 def youtube_authenticate(account_name: str) -> str:
     """Authenticate with a saved YouTube account"""
     global _yt_credentials, _yt_service, _yt_account_name
@@ -172,7 +294,6 @@ def youtube_authenticate(account_name: str) -> str:
     
     try:
         from google.oauth2.credentials import Credentials
-        from googleapiclient.discovery import build
         from google.auth.transport.requests import Request
         
         SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
@@ -191,12 +312,16 @@ def youtube_authenticate(account_name: str) -> str:
         # Refresh if expired
         if creds and creds.expired and creds.refresh_token:
             creds.refresh(Request())
-            # Save refreshed token (file-based only)
+            # Save refreshed token (file-based only) off the auth path
             if account_name != "env":
-                creds_file.write_text(creds.to_json())
+                threading.Thread(
+                    target=_write_credentials_atomic,
+                    args=(creds_file, creds.to_json()),
+                    daemon=True,
+                ).start()
         
         _yt_credentials = creds
-        _yt_service = build('youtube', 'v3', credentials=creds)
+        _yt_service = _build_youtube_service(creds)
         _yt_account_name = account_name
         
         return f"✅ Authenticated as: {account_name}"
@@ -217,18 +342,16 @@ def youtube_setup_new_account(account_name: str, client_secret_json: str) -> str
         return "❌ Please paste the client_secret.json content"
     
     try:
-        import json as _json
         from google_auth_oauthlib.flow import InstalledAppFlow
-        from googleapiclient.discovery import build
         
         SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
         
         # Parse the JSON
-        secret_data = _json.loads(client_secret_json)
+        secret_data = json.loads(client_secret_json)
         
         # Save temporarily for the flow
         temp_secret = Path(tempfile.gettempdir()) / f"client_secret_{uuid.uuid4().hex[:8]}.json"
-        temp_secret.write_text(_json.dumps(secret_data))
+        temp_secret.write_text(json.dumps(secret_data))
         
         try:
             flow = InstalledAppFlow.from_client_secrets_file(str(temp_secret), SCOPES)
@@ -242,14 +365,14 @@ def youtube_setup_new_account(account_name: str, client_secret_json: str) -> str
         creds_file.write_text(credentials.to_json())
         
         _yt_credentials = credentials
-        _yt_service = build('youtube', 'v3', credentials=credentials)
+        _yt_service = _build_youtube_service(credentials)
         _yt_account_name = account_name.strip()
         
         return f"✅ Account '{account_name.strip()}' set up and authenticated! You can now publish videos."
         
     except ImportError:
         return "❌ Google API libraries not installed. Run: pip install google-auth-oauthlib google-api-python-client"
-    except _json.JSONDecodeError:
+    except json.JSONDecodeError:
         return "❌ Invalid JSON. Please paste the full content of your client_secret.json file."
     except Exception as e:
         return f"❌ Setup failed: {e}"
@@ -260,6 +383,7 @@ def translate_text_for_youtube(text: str, language: str) -> str:
     if language == "English" or not text.strip():
         return text
     try:
+        from translator import Translator
         translator = Translator(target_language=f"{language} - Female")
         translated = translator.translate(text)
         return translated if translated else text
@@ -268,6 +392,31 @@ def translate_text_for_youtube(text: str, language: str) -> str:
         return text
 
 
+def _throttled_progress(progress, min_interval: float = 0.5, min_step: float = 0.05):
+    """Wrap a gr.Progress so it pushes at most one update per interval/step.
+
+    Updates are forwarded when min_interval seconds have passed, the value has
+    moved by min_step, or the task has finished; others are dropped. The
+    returned callable reports whether the update was forwarded.
+    """
+    last = {"pct": None, "t": 0.0}
+
+    def report(pct: float, desc: str):
+        now = time.monotonic()
+        if (
+            last["pct"] is None
+            or pct >= 1.0
+            or now - last["t"] >= min_interval
+            or abs(pct - last["pct"]) >= min_step
+        ):
+            last["pct"], last["t"] = pct, now
+            progress(pct, desc=desc)
+            return True
+        return False
+
+    return report
+
+
 def publish_to_youtube(
     video_path: str,
     title: str,
@@ -276,36 +425,50 @@ def publish_to_youtube(
     privacy: str,
     auto_translate: bool,
     progress=gr.Progress()
-) -> str:
-    """Publish the generated video to YouTube"""
+):
+    """Publish the generated video to YouTube.
+
+    Generator: streams status lines into the result box while the upload runs;
+    the last value yielded is the final result.
+    """
     global _yt_service
     
     if not _yt_service:
-        return "❌ Not authenticated. Please authenticate with YouTube first."
+        yield "❌ Not authenticated. Please authenticate with YouTube first."
+        return
     
     if not video_path:
-        return "❌ No video to publish. Generate a video first."
+        yield "❌ No video to publish. Generate a video first."
+        return
     
     if not Path(video_path).exists():
-        return "❌ Video file not found. Generate a new video."
+        yield "❌ Video file not found. Generate a new video."
+        return
     
     if not title.strip():
-        return "❌ Please enter a video title."
+        yield "❌ Please enter a video title."
+        return
     
     try:
-        import time as _time
         from googleapiclient.http import MediaFileUpload
         from googleapiclient.errors import HttpError
         
         progress(0.1, desc="Preparing upload...")
+        yield "⏳ Preparing upload..."
         
         # Auto-translate title and description if needed
         final_title = title
         final_description = description
         if auto_translate and language != "English":
             progress(0.15, desc=f"Translating to {language}...")
-            final_title = translate_text_for_youtube(title, language)
-            final_description = translate_text_for_youtube(description, language)
+            yield f"⏳ Translating to {language}..."
+            # Each call builds its own Translator (and HTTP session), so the two
+            # requests can safely run concurrently
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                title_future = pool.submit(translate_text_for_youtube, title, language)
+                description_future = pool.submit(translate_text_for_youtube, description, language)
+                final_title = title_future.result()
+                final_description = description_future.result()
         
         # Add #shorts hashtag
         if "#shorts" not in final_description.lower():
@@ -331,170 +494,66 @@ def publish_to_youtube(
             video_path,
             mimetype='video/mp4',
             resumable=True,
-            chunksize=5 * 1024 * 1024
+            chunksize=8 * 1024 * 1024
         )
         
+        # One resumable session for the whole upload: after a failed chunk,
+        # next_chunk() asks YouTube how many bytes it already has and resumes
+        # from there instead of re-sending the file.
+        request = _yt_service.videos().insert(
+            part='snippet,status',
+            body=body,
+            media_body=media
+        )
+        progress(0.2, desc="Uploading to YouTube...")
+        yield "⏳ Uploading to YouTube..."
+        report = _throttled_progress(progress)
+
         max_retries = 3
-        for attempt in range(1, max_retries + 1):
+        retries = 0
+        response = None
+        while response is None:
             try:
-                progress(0.2, desc=f"Uploading to YouTube{' (retry ' + str(attempt) + ')' if attempt > 1 else ''}...")
-                
-                request = _yt_service.videos().insert(
-                    part='snippet,status',
-                    body=body,
-                    media_body=media
-                )
-                
-                response = None
-                while response is None:
-                    status, response = request.next_chunk()
-                    if status:
-                        pct = 0.2 + (status.progress() * 0.7)
-                        progress(pct, desc=f"Uploading: {int(status.progress() * 100)}%")
-                
-                video_id = response.get('id')
-                video_url = f"https://youtube.com/shorts/{video_id}"
-                
-                progress(1.0, desc="✅ Published!")
-                
-                lang_note = f" ({language})" if language != "English" else ""
-                return f"✅ Published to YouTube!\n\n🔗 {video_url}\n\n📺 Title: {final_title}{lang_note}\n🔒 Privacy: {privacy}"
-                
+                status, response = request.next_chunk()
+                if status:
+                    pct = 0.2 + (status.progress() * 0.7)
+                    msg = f"Uploading: {int(status.progress() * 100)}%"
+                    if report(pct, msg):
+                        yield f"⏳ {msg}"
             except HttpError as e:
-                if e.resp.status in (500, 502, 503, 504) and attempt < max_retries:
-                    wait = 2 ** attempt * 5
-                    progress(0.2, desc=f"Server error, retrying in {wait}s...")
-                    _time.sleep(wait)
-                else:
-                    return f"❌ Upload failed: {e}"
+                if e.resp.status not in (500, 502, 503, 504) or retries >= max_retries:
+                    yield f"❌ Upload failed: {e}"
+                    return
+                retries += 1
+                wait = 2 ** retries * 5 * random.uniform(0.5, 1.5)
+                progress(0.2, desc=f"Server error, resuming in {wait:.0f}s...")
+                yield f"⚠️ Server error, resuming in {wait:.0f}s..."
+                time.sleep(wait)
             except Exception as e:
-                if attempt < max_retries:
-                    wait = 2 ** attempt * 5
-                    progress(0.2, desc=f"Error, retrying in {wait}s...")
-                    _time.sleep(wait)
-                else:
-                    return f"❌ Upload failed after {max_retries} attempts: {e}"
-        
-        return "❌ Upload failed after all retries"
+                if retries >= max_retries:
+                    yield f"❌ Upload failed after {max_retries} retries: {e}"
+                    return
+                retries += 1
+                wait = 2 ** retries * 5 * random.uniform(0.5, 1.5)
+                progress(0.2, desc=f"Error, resuming in {wait:.0f}s...")
+                yield f"⚠️ Error, resuming in {wait:.0f}s..."
+                time.sleep(wait)
+
+        video_id = response.get('id')
+        video_url = f"https://youtube.com/shorts/{video_id}"
+
+        progress(1.0, desc="✅ Published!")
+
+        lang_note = f" ({language})" if language != "English" else ""
+        yield f"✅ Published to YouTube!\n\n🔗 {video_url}\n\n📺 Title: {final_title}{lang_note}\n🔒 Privacy: {privacy}"
         
     except ImportError:
-        return "❌ Google API libraries not installed. Run: pip install google-auth-oauthlib google-api-python-client"
+        yield "❌ Google API libraries not installed. Run: pip install google-auth-oauthlib google-api-python-client"
     except Exception as e:
-        return f"❌ Error: {e}"
-
-# Voice options organized by language and gender
-VOICE_OPTIONS = {
-    "English": {
-        "Male": [
-            ("Christopher (US)", "en-US-ChristopherNeural"),
-            ("Guy (US)", "en-US-GuyNeural"),
-            ("Eric (US)", "en-US-EricNeural"),
-            ("Ryan (UK)", "en-GB-RyanNeural"),
-            ("Ravi (India)", "en-IN-PrabhatNeural"),
-        ],
-        "Female": [
-            ("Jenny (US)", "en-US-JennyNeural"),
-            ("Aria (US)", "en-US-AriaNeural"),
-            ("Ava (US)", "en-US-AvaNeural"),
-            ("Michelle (US)", "en-US-MichelleNeural"),
-            ("Emma (US)", "en-US-EmmaNeural"),
-            ("Sonia (UK)", "en-GB-SoniaNeural"),
-            ("Neerja (India)", "en-IN-NeerjaNeural"),
-        ],
-    },
-    "Hindi": {
-        "Male": [("Madhur", "hi-IN-MadhurNeural")],
-        "Female": [("Swara", "hi-IN-SwaraNeural")],
-    },
-    "Spanish": {
-        "Male": [("Alvaro (Spain)", "es-ES-AlvaroNeural"), ("Jorge (Mexico)", "es-MX-JorgeNeural")],
-        "Female": [("Elvira (Spain)", "es-ES-ElviraNeural"), ("Dalia (Mexico)", "es-MX-DaliaNeural")],
-    },
-    "French": {
-        "Male": [("Henri", "fr-FR-HenriNeural")],
-        "Female": [("Denise", "fr-FR-DeniseNeural")],
-    },
-    "German": {
-        "Male": [("Conrad", "de-DE-ConradNeural")],
-        "Female": [("Katja", "de-DE-KatjaNeural")],
-    },
-    "Portuguese": {
-        "Male": [("Antonio (Brazil)", "pt-BR-AntonioNeural")],
-        "Female": [("Francisca (Brazil)", "pt-BR-FranciscaNeural")],
-    },
-    "Italian": {
-        "Male": [("Diego", "it-IT-DiegoNeural")],
-        "Female": [("Elsa", "it-IT-ElsaNeural")],
-    },
-    "Japanese": {
-        "Male": [("Keita", "ja-JP-KeitaNeural")],
-        "Female": [("Nanami", "ja-JP-NanamiNeural")],
-    },
-    "Korean": {
-        "Male": [("InJoon", "ko-KR-InJoonNeural")],
-        "Female": [("SunHi", "ko-KR-SunHiNeural")],
-    },
-    "Chinese": {
-        "Male": [("Yunyang", "zh-CN-YunyangNeural")],
-        "Female": [("Xiaoxiao", "zh-CN-XiaoxiaoNeural")],
-    },
-    "Arabic": {
-        "Male": [("Hamed", "ar-SA-HamedNeural")],
-        "Female": [("Zariyah", "ar-SA-ZariyahNeural")],
-    },
-    "Russian": {
-        "Male": [("Dmitry", "ru-RU-DmitryNeural")],
-        "Female": [("Svetlana", "ru-RU-SvetlanaNeural")],
-    },
-    "Dutch": {
-        "Male": [("Maarten", "nl-NL-MaartenNeural")],
-        "Female": [("Colette", "nl-NL-ColetteNeural")],
-    },
-    "Turkish": {
-        "Male": [("Ahmet", "tr-TR-AhmetNeural")],
-        "Female": [("Emel", "tr-TR-EmelNeural")],
-    },
-    "Polish": {
-        "Male": [("Marek", "pl-PL-MarekNeural")],
-        "Female": [("Zofia", "pl-PL-ZofiaNeural")],
-    },
-    "Swedish": {
-        "Male": [("Mattias", "sv-SE-MattiasNeural")],
-        "Female": [("Sofie", "sv-SE-SofieNeural")],
-    },
-    "Norwegian": {
-        "Male": [("Finn", "nb-NO-FinnNeural")],
-        "Female": [("Pernille", "nb-NO-PernilleNeural")],
-    },
-    "Danish": {
-        "Male": [("Jeppe", "da-DK-JeppeNeural")],
-        "Female": [("Christel", "da-DK-ChristelNeural")],
-    },
-    "Kannada": {
-        "Male": [("Gagan", "kn-IN-GaganNeural")],
-        "Female": [("Sapna", "kn-IN-SapnaNeural")],
-    },
-    "Tamil": {
-        "Male": [("Valluvar", "ta-IN-ValluvarNeural")],
-        "Female": [("Pallavi", "ta-IN-PallaviNeural")],
-    },
-    "Telugu": {
-        "Male": [("Mohan", "te-IN-MohanNeural")],
-        "Female": [("Shruti", "te-IN-ShrutiNeural")],
-    },
-    "Marathi": {
-        "Male": [("Manohar", "mr-IN-ManoharNeural")],
-        "Female": [("Aarohi", "mr-IN-AarohiNeural")],
-    },
-    "Bengali": {
-        "Male": [("Bashkar", "bn-IN-BashkarNeural")],
-        "Female": [("Tanishaa", "bn-IN-TanishaaNeural")],
-    },
-    "Gujarati": {
-        "Male": [("Niranjan", "gu-IN-NiranjanNeural")],
-        "Female": [("Dhwani", "gu-IN-DhwaniNeural")],
-    },
-}
+        yield f"❌ Error: {e}"
+
+# Voice options organized by language and gender: {language: {gender: [[name, voice_id], ...]}}
+VOICE_OPTIONS = json.loads(Path(__file__).with_name("voices.json").read_bytes())
 
 # Hello translations for preview
 HELLO_TRANSLATIONS = {
@@ -525,110 +584,228 @@ HELLO_TRANSLATIONS = {
 }
 
 
+# Voice catalogue flattened once into parallel tuples; each (language, gender)
+# owns a contiguous range, so choices are a prebuilt tuple and ids an index lookup
+_VOICE_NAMES = tuple(
+    name for types in VOICE_OPTIONS.values() for voices in types.values() for name, _ in voices
+)
+_VOICE_IDS = tuple(
+    vid for types in VOICE_OPTIONS.values() for voices in types.values() for _, vid in voices
+)
+_VOICE_BY_LANG_TYPE = {}
+_VOICE_INDEX = {}
+_start = 0
+for _lang, _types in VOICE_OPTIONS.items():
+    for _vt, _voices in _types.items():
+        _VOICE_BY_LANG_TYPE[(_lang, _vt)] = _VOICE_NAMES[_start:_start + len(_voices)]
+        for _offset, (_name, _) in enumerate(_voices):
+            _VOICE_INDEX[(_lang, _vt, _name)] = _start + _offset
+        _start += len(_voices)
+del _start, _lang, _types, _vt, _voices, _offset, _name
+
+
 def get_voice_choices(language: str, voice_type: str) -> list:
     """Get voice choices based on language and gender"""
-    if language in VOICE_OPTIONS and voice_type in VOICE_OPTIONS[language]:
-        return [name for name, _ in VOICE_OPTIONS[language][voice_type]]
-    return ["Default"]
+    return list(_voice_choices(language, voice_type))
+
+
+def _voice_choices(language: str, voice_type: str) -> tuple:
+    """Shared, preallocated choices tuple (do not mutate)"""
+    return _VOICE_BY_LANG_TYPE.get((language, voice_type), ("Default",))
 
 
 def get_voice_id(language: str, voice_type: str, voice_name: str) -> str:
     """Get the Edge TTS voice ID from selections"""
-    if language in VOICE_OPTIONS and voice_type in VOICE_OPTIONS[language]:
-        for name, voice_id in VOICE_OPTIONS[language][voice_type]:
-            if name == voice_name:
-                return voice_id
+    index = _VOICE_INDEX.get((language, voice_type, voice_name))
+    if index is not None:
+        return _VOICE_IDS[index]
     # Fallback
-    return EDGE_TTS_VOICES.get(f"{language} - {voice_type}", "en-US-ChristopherNeural")
+    return _edge_voices().get(f"{language} - {voice_type}", "en-US-ChristopherNeural")
+
 
+def update_voice_dropdown(language: str, voice_type: str, shown_choices: list = None):
+    """Update voice dropdown when language or voice type changes.
 
-def update_voice_dropdown(language: str, voice_type: str):
-    """Update voice dropdown when language or voice type changes"""
-    choices = get_voice_choices(language, voice_type)
-    return gr.update(choices=choices, value=choices[0] if choices else "Default")
+    shown_choices is the per-session list currently in the dropdown; when it is
+    unchanged a no-op update is returned so the client skips the re-render.
+    """
+    choices = _voice_choices(language, voice_type)
+    if choices == shown_choices:
+        return gr.update(), shown_choices
+    return gr.update(choices=list(choices), value=choices[0] if choices else "Default"), choices
 
 
-def preview_voice(language: str, voice_type: str, voice_name: str):
-    """Generate a preview audio of the selected voice saying Hello"""
-    import asyncio
+# Preview streaming: edge-tts emits 24kHz/48kbps MP3, i.e. ~6 bytes per ms.
+# Flush the first ~20 ms as soon as it arrives, then grow the chunk size so the
+# player starts early without flooding the client with tiny frames.
+_PREVIEW_BYTES_PER_MS = 6
+_PREVIEW_CHUNK_MS = (20, 40, 80, 160)
+
+# Content-addressed preview cache. Kept outside TEMP_DIR, which is wiped after
+# every video job; least recently played files are evicted past the cap.
+PREVIEW_CACHE_DIR = Path(tempfile.gettempdir()) / "videogen_preview_cache"
+PREVIEW_CACHE_MAX_FILES = 64
+
+
+def _preview_cache_path(voice_id: str, text: str) -> Path:
+    key = hashlib.sha1(f"{voice_id}|{text}".encode("utf-8")).hexdigest()[:16]
+    return PREVIEW_CACHE_DIR / f"{key}.mp3"
 
+
+def _evict_preview_cache():
+    """Drop the least recently used previews beyond PREVIEW_CACHE_MAX_FILES"""
     try:
-        voice_id = get_voice_id(language, voice_type, voice_name)
-        hello_text = HELLO_TRANSLATIONS.get(language, "Hello! This is how I sound.")
+        with os.scandir(PREVIEW_CACHE_DIR) as entries:
+            files = [(e.stat().st_mtime, e.path) for e in entries if e.name.endswith(".mp3")]
+    except OSError:
+        return
+    if len(files) <= PREVIEW_CACHE_MAX_FILES:
+        return
+    files.sort()
+    for _, path in files[:len(files) - PREVIEW_CACHE_MAX_FILES]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+_preview_loop = None
+_preview_loop_lock = threading.Lock()
 
-        # Generate preview audio
-        temp_dir = Path(tempfile.gettempdir()) / "videogen_temp"
-        temp_dir.mkdir(exist_ok=True)
-        preview_path = temp_dir / f"preview_{uuid.uuid4().hex[:8]}.mp3"
 
-        import edge_tts
+def _get_preview_loop():
+    """Return the persistent event loop used for TTS previews, starting it once"""
+    global _preview_loop
 
-        async def generate():
-            communicate = edge_tts.Communicate(hello_text, voice_id)
-            await communicate.save(str(preview_path))
+    with _preview_loop_lock:
+        if _preview_loop is None:
+            _preview_loop = asyncio.new_event_loop()
+            threading.Thread(target=_preview_loop.run_forever, daemon=True).start()
+    return _preview_loop
 
-        asyncio.run(generate())
 
-        return str(preview_path)
+def _stream_tts_chunks(text: str, voice_id: str):
+    """Yield raw MP3 chunks from edge-tts, bridging its async stream to a sync generator"""
+    import edge_tts
+
+    chunks = queue.Queue()
+    done = object()
+
+    async def produce():
+        try:
+            communicate = edge_tts.Communicate(text, voice_id)
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    chunks.put(chunk["data"])
+        except Exception as e:
+            chunks.put(e)
+        finally:
+            chunks.put(done)
+
+    asyncio.run_coroutine_threadsafe(produce(), _get_preview_loop())
+
+    while True:
+        item = chunks.get()
+        if item is done:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+def preview_voice(language: str, voice_type: str, voice_name: str):
+    """Stream a preview audio of the selected voice saying Hello"""
+    try:
+        voice_id = get_voice_id(language, voice_type, voice_name)
+        hello_text = HELLO_TRANSLATIONS.get(language, HELLO_TRANSLATIONS["English"])
+
+        cached = _preview_cache_path(voice_id, hello_text)
+        if cached.exists():
+            os.utime(cached)  # mark as recently used
+            yield cached.read_bytes()
+            return
+
+        # Progressively larger chunks: 20 ms, 40 ms, 80 ms, then 160 ms
+        step = 0
+        pending = bytearray()
+        audio = bytearray()
+        for data in _stream_tts_chunks(hello_text, voice_id):
+            audio.extend(data)
+            pending.extend(data)
+            target = _PREVIEW_CHUNK_MS[step] * _PREVIEW_BYTES_PER_MS
+            if len(pending) >= target:
+                yield bytes(pending)
+                pending.clear()
+                step = min(step + 1, len(_PREVIEW_CHUNK_MS) - 1)
+        if pending:
+            yield bytes(pending)
+
+        if audio:
+            PREVIEW_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_suffix(f".{uuid.uuid4().hex[:8]}.tmp")
+            tmp.write_bytes(audio)
+            os.replace(tmp, cached)
+            _evict_preview_cache()
 
     except Exception as e:
         print(f"Preview error: {e}")
-        return None
+        return
 
 
 def update_topic_fields(selected_label: str):
     """Populate topic and keywords based on preset selection"""
-    for preset in TOPIC_PRESETS:
-        if preset["label"] == selected_label:
-            return preset["topic"], preset["keywords"]
-    return "", ""
+    preset = TOPIC_PRESETS_BY_LABEL.get(selected_label)
+    if preset is None:
+        return "", ""
+    return preset["topic"], preset["keywords"]
+
+
+# Everything except alphanumerics and spaces (\w also matches "_", so drop it too)
+_HASHTAG_STRIP_RE = re.compile(r"[^\w ]|_")
 
 
 def _format_hashtags(keywords: str) -> str:
     tags = []
     for kw in [k.strip() for k in keywords.split(",") if k.strip()]:
-        tag = "#" + "".join(ch for ch in kw if ch.isalnum() or ch == " ").strip().replace(" ", "")
+        tag = "#" + _HASHTAG_STRIP_RE.sub("", kw).strip().replace(" ", "")
         if tag != "#":
             tags.append(tag)
-    if "#shorts" not in [t.lower() for t in tags]:
+    if not any(t.lower() == "#shorts" for t in tags):
         tags.append("#shorts")
     return " ".join(tags)
 
 
+# Section header lines ("SCRIPT:", "Title:", ...); the rest of the header line is ignored
+_GROQ_SECTION_RE = re.compile(
+    r"^[^\S\n]*(script|title|description|keywords):.*$\n?",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
 def _parse_groq_response(raw: str) -> tuple:
     """Parse Groq response for SCRIPT/TITLE/DESCRIPTION/KEYWORDS"""
-    script = ""
+    # [preamble, name1, body1, name2, body2, ...]
+    parts = _GROQ_SECTION_RE.split(raw)
+    sections = {}
+    for name, body in zip(parts[1::2], parts[2::2]):
+        sections.setdefault(name.lower(), []).append(body)
+
+    script = "".join(sections.get("script", []))
+
+    # Title is the first non-empty line of its section
     title = ""
-    description = ""
-    keywords = ""
-    current_section = None
-
-    for line in raw.split("\n"):
-        line_lower = line.lower().strip()
-        if line_lower.startswith("script:"):
-            current_section = "script"
-            continue
-        elif line_lower.startswith("title:"):
-            current_section = "title"
-            continue
-        elif line_lower.startswith("description:"):
-            current_section = "description"
-            continue
-        elif line_lower.startswith("keywords:"):
-            current_section = "keywords"
-            continue
-
-        if current_section == "script":
-            script += line + "\n"
-        elif current_section == "title":
-            if line.strip():
-                title = line.strip()
-                current_section = None
-        elif current_section == "description":
-            description += line + "\n"
-        elif current_section == "keywords":
-            if line.strip():
-                keywords += line.strip() + " "
+    for body in sections.get("title", []):
+        first = next((line.strip() for line in body.split("\n") if line.strip()), "")
+        if first:
+            title = first
+
+    description = "".join(sections.get("description", []))
+    keywords = " ".join(
+        line.strip()
+        for body in sections.get("keywords", [])
+        for line in body.split("\n")
+        if line.strip()
+    )
 
     script = script.strip() if script else raw
     description = description.strip()
@@ -637,27 +814,56 @@ def _parse_groq_response(raw: str) -> tuple:
     return script, keywords, title, description
 
 
-def _encode_image_to_base64(image) -> str:
-    """Encode PIL/numpy image to base64 data URL"""
-    import io
+def _encode_image_to_base64(image, fmt: str = "JPEG") -> str:
+    """Encode PIL/numpy image to base64 data URL.
+
+    JPEG (quality 85) by default: far smaller and faster to encode than PNG for
+    photos. Pass fmt="PNG" when the caller needs lossless output.
+    """
     from PIL import Image
     import numpy as np
 
     if image is None:
         return ""
 
+    fmt = fmt.upper()
+
+    # RGB uint8 arrays can go straight to libjpeg-turbo via OpenCV, skipping
+    # the PIL image round-trip (OpenCV is optional)
+    if (
+        fmt == "JPEG"
+        and isinstance(image, np.ndarray)
+        and image.dtype == np.uint8
+        and image.ndim == 3
+        and image.shape[2] == 3
+    ):
+        try:
+            import cv2
+            ok, encoded = cv2.imencode(".jpg", image[..., ::-1], [cv2.IMWRITE_JPEG_QUALITY, 85])
+            if ok:
+                return "data:image/jpeg;base64," + _b64.b64encode(encoded).decode("ascii")
+        except ImportError:
+            pass
+
     if isinstance(image, np.ndarray):
         image = Image.fromarray(image)
 
     buffer = io.BytesIO()
-    image.save(buffer, format="PNG")
-    b64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
-    return f"data:image/png;base64,{b64}"
+    if fmt == "JPEG":
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        image.save(buffer, format="JPEG", quality=85, optimize=False)
+    else:
+        image.save(buffer, format=fmt)
+    # Encode straight from the BytesIO's internal buffer (no getvalue() copy);
+    # base64 output is pure ASCII
+    with buffer.getbuffer() as raw:
+        b64 = _b64.b64encode(raw).decode("ascii")
+    return f"data:image/{fmt.lower()};base64," + b64
 
 
 def _decode_base64_image(data_url: str):
     """Decode a base64 data URL into a PIL image"""
-    import io
     from PIL import Image
 
     if not data_url or not data_url.strip():
@@ -668,7 +874,7 @@ def _decode_base64_image(data_url: str):
         data_url = data_url.split(",", 1)[1]
 
     try:
-        raw = base64.b64decode(data_url)
+        raw = _b64.b64decode(data_url)
         return Image.open(io.BytesIO(raw)).convert("RGB")
     except Exception as e:
         print(f"[_decode_base64_image] Error: {e}")
@@ -731,10 +937,10 @@ Return ONLY the content in this format, no explanations."""
     }
 
     progress(0.1, desc="Generating script with Groq...")
-    response = requests.post(GROQ_API_URL, headers=headers, json=data, timeout=60)
+    response = _get_api_session().post(GROQ_API_URL, headers=headers, json=data, timeout=60)
     response.raise_for_status()
 
-    raw = response.json()["choices"][0]["message"]["content"].strip()
+    raw = _json_loads(response.content)["choices"][0]["message"]["content"].strip()
 
     script, parsed_keywords, title, description = _parse_groq_response(raw)
 
@@ -767,8 +973,10 @@ def generate_script_from_image(
         raise gr.Error("Could not read image")
 
     # Remove data URL prefix for Gemini
+    mime_type = "image/jpeg"
     if "," in image_b64:
-        image_b64 = image_b64.split(",", 1)[1]
+        header, image_b64 = image_b64.split(",", 1)
+        mime_type = header[len("data:"):].split(";", 1)[0] or mime_type
 
     prompt = """Create a YouTube Shorts script based on the image.
 Follow this EXACT format:
@@ -809,7 +1017,7 @@ Return ONLY the content in this format, no explanations."""
                 {"text": prompt},
                 {
                     "inline_data": {
-                        "mime_type": "image/png",
+                        "mime_type": mime_type,
                         "data": image_b64
                     }
                 }
@@ -823,9 +1031,9 @@ Return ONLY the content in this format, no explanations."""
 
     progress(0.1, desc="Analyzing image with Gemini...")
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=60)
+        response = _get_api_session().post(url, headers=headers, json=data, timeout=60)
         response.raise_for_status()
-        result = response.json()
+        result = _json_loads(response.content)
         
         raw = result["candidates"][0]["content"]["parts"][0]["text"].strip()
         
@@ -862,6 +1070,53 @@ def generate_script_from_base64(
     return generate_script_from_image(image, language, progress=progress)
 
 
+# Warm VideoGenerator shared across jobs (fonts, fetchers and sessions are
+# reused); per-job state is reset in _get_video_generator()
+_GENERATOR = None
+_GEN_LOCK = threading.Lock()
+
+class _LRUCache(OrderedDict):
+    """Small thread-safe LRU dict; evicts the least recently used entry past capacity"""
+
+    def __init__(self, capacity: int):
+        super().__init__()
+        self.capacity = capacity
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self:
+                return default
+            self.move_to_end(key)
+            return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            if len(self) > self.capacity:
+                self.popitem(last=False)
+
+
+# Translated narration keyed by sha256(script|language), reused across jobs
+_TRANSLATION_CACHE = _LRUCache(256)
+
+
+def _get_video_generator():
+    """Return the shared VideoGenerator, constructing it on first use"""
+    global _GENERATOR
+    with _GEN_LOCK:
+        if _GENERATOR is None:
+            from video_generator import VideoGenerator
+            _GENERATOR = VideoGenerator(pexels_api_key=PEXELS_API_KEY)
+            _GENERATOR.translation_cache = _TRANSLATION_CACHE
+        generator = _GENERATOR
+    # cleanup_temp_files() removes temp_dir after each job
+    generator.temp_dir.mkdir(parents=True, exist_ok=True)
+    generator.multi_fetcher.downloaded_urls.clear()
+    return generator
+
+
 def generate_video(
     script_text: str,
     stock_keywords: str,
@@ -878,9 +1133,6 @@ def generate_video(
 ) -> str:
     """Generate a YouTube Shorts video from script text."""
     
-    # Reset cancellation flag at start of new job
-    reset_cancel()
-    
     if not script_text.strip():
         raise gr.Error("Please enter a script!")
 
@@ -912,14 +1164,20 @@ def generate_video(
     print(f"[generate_video] Selected: language={language}, voice_type={voice_type}, voice_name={voice_name}")
     print(f"[generate_video] voice_id resolved to: {voice_id}")
 
+    job = start_job()
     try:
         # Check for cancellation
         if is_cancelled():
             raise gr.Error("Generation cancelled")
             
-        # Initialize
+        # Initialize generator and parse script concurrently (construction
+        # only costs anything on the first, cold job)
         progress(0.01, desc="Initializing video generator...")
-        generator = VideoGenerator(pexels_api_key=PEXELS_API_KEY)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            generator_future = pool.submit(_get_video_generator)
+            segments_future = pool.submit(_parse_script_cached, script_text)
+            generator = generator_future.result()
+            segments = segments_future.result()
         generator.audio_generator.voice = voice
         generator.audio_generator.voice_id = voice_id  # Use specific voice ID
         print(f"[generate_video] Set audio_generator.voice_id = {generator.audio_generator.voice_id}")
@@ -928,9 +1186,7 @@ def generate_video(
         if is_cancelled():
             raise gr.Error("Generation cancelled")
             
-        # Parse script
         progress(0.03, desc="Parsing script...")
-        segments = parse_script(script_text)
         if not segments:
             raise gr.Error("Could not parse script. Check the format.")
 
@@ -939,10 +1195,12 @@ def generate_video(
         output_filename = f"short_{job_id}.mp4"
 
         # Create progress callback that checks for cancellation
+        report = _throttled_progress(progress)
+
         def progress_callback(pct, msg):
             if is_cancelled():
                 raise Exception("Generation cancelled by user")
-            progress(pct, desc=msg)
+            report(pct, msg)
 
         # Check for cancellation
         if is_cancelled():
@@ -994,6 +1252,8 @@ def generate_video(
         if "cancelled" in str(e).lower():
             raise gr.Error(" Generation cancelled")
         raise gr.Error(f"Error generating video: {str(e)}")
+    finally:
+        finish_job(job)
 
 
 # Example scripts
@@ -1043,6 +1303,22 @@ Try this tonight.""",
 ]
 
 
+def _script_hash(script_text: str) -> str:
+    return hashlib.sha1(script_text.strip().encode("utf-8")).hexdigest()
+
+
+# Bundled examples never change, so parse them once at import
+_EXAMPLE_SEGMENTS = {_script_hash(s): parse_script(s) for s in EXAMPLE_SCRIPTS}
+
+
+def _parse_script_cached(script_text: str):
+    """parse_script, short-circuited for the bundled example scripts"""
+    segments = _EXAMPLE_SEGMENTS.get(_script_hash(script_text))
+    if segments is not None:
+        return segments
+    return parse_script(script_text)
+
+
 # Create Gradio interface - NO QUEUE for immediate response
 with gr.Blocks(
     title="YouTube Shorts Generator",
@@ -1111,15 +1387,19 @@ with gr.Blocks(
                 generate_script_btn = gr.Button("⚡ Generate Script + Title + Description", size="sm")
 
             with gr.Accordion("🖼️ Generate Script from Image", open=False):
-                image_input = gr.Image(
-                    label="📷 Upload or Front Camera",
-                    sources=["upload", "webcam"],
-                    type="pil",
-                )
+                # Body is mounted hidden and revealed by the button, so the
+                # image/webcam widget isn't laid out on first paint
+                image_show_btn = gr.Button("📷 Show Image Tools", size="sm", variant="secondary")
+                with gr.Column(visible=False) as image_panel:
+                    image_input = gr.Image(
+                        label="📷 Upload or Front Camera",
+                        sources=["upload", "webcam"],
+                        type="pil",
+                    )
                 
-                with gr.Row():
-                    generate_image_script_btn = gr.Button("🔍 Generate from Image", size="sm")
-                    back_camera_btn = gr.Button("📸 Use Back Camera", size="sm", variant="secondary")
+                    with gr.Row():
+                        generate_image_script_btn = gr.Button("🔍 Generate from Image", size="sm")
+                        back_camera_btn = gr.Button("📸 Use Back Camera", size="sm", variant="secondary")
 
             script_input = gr.Textbox(
                 label=" Video Script",
@@ -1186,6 +1466,7 @@ Your call to action.""",
                     )
 
                 with gr.Row():
+                    voice_choices_state = gr.State(_voice_choices("English", "Male"))
                     voice_name = gr.Dropdown(
                         label=" Voice",
                         choices=get_voice_choices("English", "Male"),
@@ -1203,7 +1484,9 @@ Your call to action.""",
                 voice_preview = gr.Audio(
                     label="Voice Preview",
                     visible=True,
+                    streaming=True,
                     autoplay=True,
+                    format="mp3",
                 )
 
             with gr.Accordion("🎬 Video Sources", open=False):
@@ -1271,48 +1554,50 @@ Your call to action.""",
             gr.Markdown("### 📤 Publish to YouTube")
             
             with gr.Accordion("🔑 YouTube Authentication", open=False):
-                saved_accounts = get_youtube_accounts()
+                yt_auth_show_btn = gr.Button("🔑 Show Account Settings", size="sm", variant="secondary")
+                with gr.Column(visible=False) as yt_auth_panel:
+                    saved_accounts = get_youtube_accounts()
                 
-                gr.Markdown("**HF Secrets option:** set `YOUTUBE_OAUTH_CREDENTIALS_JSON` (or `YOUTUBE_OAUTH_CREDENTIALS_B64`) to use the `env` account.")
-
-                if saved_accounts:
-                    gr.Markdown("**Use a saved account:**")
-                    with gr.Row():
+                    gr.Markdown("**HF Secrets option:** set `YOUTUBE_OAUTH_CREDENTIALS_JSON` (or `YOUTUBE_OAUTH_CREDENTIALS_B64`) to use the `env` account.")
+
+                    if saved_accounts:
+                        gr.Markdown("**Use a saved account:**")
+                        with gr.Row():
+                            yt_account_dropdown = gr.Dropdown(
+                                label="Saved Account",
+                                choices=saved_accounts,
+                                value=saved_accounts[0] if saved_accounts else None,
+                                info="Select a previously configured account",
+                            )
+                            yt_auth_btn = gr.Button("🔐 Authenticate", size="sm")
+                    else:
                         yt_account_dropdown = gr.Dropdown(
                             label="Saved Account",
-                            choices=saved_accounts,
-                            value=saved_accounts[0] if saved_accounts else None,
-                            info="Select a previously configured account",
+                            choices=[],
+                            value=None,
+                            visible=False,
                         )
-                        yt_auth_btn = gr.Button("🔐 Authenticate", size="sm")
-                else:
-                    yt_account_dropdown = gr.Dropdown(
-                        label="Saved Account",
-                        choices=[],
-                        value=None,
-                        visible=False,
-                    )
-                    yt_auth_btn = gr.Button("🔐 Authenticate", visible=False, size="sm")
+                        yt_auth_btn = gr.Button("🔐 Authenticate", visible=False, size="sm")
                 
-                gr.Markdown("**Or set up a new account:**")
-                yt_new_account_name = gr.Textbox(
-                    label="Account Name",
-                    placeholder="e.g., mychannel",
-                    info="A name to identify this YouTube account",
-                )
-                yt_client_secret = gr.Textbox(
-                    label="Client Secret JSON",
-                    placeholder='Paste the full content of your client_secret.json file here',
-                    lines=3,
-                    info="From Google Cloud Console > OAuth 2.0 credentials",
-                )
-                yt_setup_btn = gr.Button("⚙️ Set Up New Account", size="sm")
+                    gr.Markdown("**Or set up a new account:**")
+                    yt_new_account_name = gr.Textbox(
+                        label="Account Name",
+                        placeholder="e.g., mychannel",
+                        info="A name to identify this YouTube account",
+                    )
+                    yt_client_secret = gr.Textbox(
+                        label="Client Secret JSON",
+                        placeholder='Paste the full content of your client_secret.json file here',
+                        lines=3,
+                        info="From Google Cloud Console > OAuth 2.0 credentials",
+                    )
+                    yt_setup_btn = gr.Button("⚙️ Set Up New Account", size="sm")
                 
-                yt_auth_status = gr.Textbox(
-                    label="Auth Status",
-                    interactive=False,
-                    value="Not authenticated",
-                )
+                    yt_auth_status = gr.Textbox(
+                        label="Auth Status",
+                        interactive=False,
+                        value="Not authenticated",
+                    )
             
             yt_title = gr.Textbox(
                 label="📺 Video Title",
@@ -1368,8 +1653,18 @@ Your call to action.""",
             soundtrack_volume,
         ],
         outputs=video_output,
+        concurrency_limit=1,
+        concurrency_id="video_gen",
     )
 
+    # Reveal lazily rendered accordion bodies (Gradio 4 accordions have no
+    # expand event, so a button inside each one does it)
+    def _reveal_panel():
+        return gr.update(visible=True), gr.update(visible=False)
+    
+    image_show_btn.click(fn=_reveal_panel, outputs=[image_panel, image_show_btn], queue=False)
+    yt_auth_show_btn.click(fn=_reveal_panel, outputs=[yt_auth_panel, yt_auth_show_btn], queue=False)
+
     # Stop button sets cancellation flag
     stop_btn.click(
         fn=request_cancel,
@@ -1378,16 +1673,13 @@ Your call to action.""",
     )
 
     # Update voice dropdown when language or voice type changes
-    language.change(
-        fn=update_voice_dropdown,
-        inputs=[language, voice_type],
-        outputs=voice_name,
-    )
-
-    voice_type.change(
+    gr.on(
+        triggers=[language.change, voice_type.change],
         fn=update_voice_dropdown,
-        inputs=[language, voice_type],
-        outputs=voice_name,
+        inputs=[language, voice_type, voice_choices_state],
+        outputs=[voice_name, voice_choices_state],
+        concurrency_limit=4,
+        concurrency_id="ui",
     )
 
     # Preview voice button
@@ -1395,6 +1687,8 @@ Your call to action.""",
         fn=preview_voice,
         inputs=[language, voice_type, voice_name],
         outputs=voice_preview,
+        concurrency_limit=4,
+        concurrency_id="ui",
     )
 
     # Topic preset change
@@ -1402,6 +1696,8 @@ Your call to action.""",
         fn=update_topic_fields,
         inputs=[topic_dropdown],
         outputs=[topic_input, topic_keywords],
+        concurrency_limit=4,
+        concurrency_id="ui",
     )
 
     # Generate script from topic
@@ -1438,6 +1734,8 @@ Your call to action.""",
         fn=youtube_authenticate,
         inputs=[yt_account_dropdown],
         outputs=yt_auth_status,
+        concurrency_limit=2,
+        concurrency_id="net",
     )
 
     # YouTube setup new account button
@@ -1445,6 +1743,8 @@ Your call to action.""",
         fn=youtube_setup_new_account,
         inputs=[yt_new_account_name, yt_client_secret],
         outputs=yt_auth_status,
+        concurrency_limit=2,
+        concurrency_id="net",
     )
 
     # YouTube publish button
@@ -1452,11 +1752,15 @@ Your call to action.""",
         fn=publish_to_youtube,
         inputs=[video_output, yt_title, yt_description, language, yt_privacy, yt_auto_translate],
         outputs=yt_publish_result,
+        concurrency_limit=2,
+        concurrency_id="net",
     )
 
 
-# Enable queue so gr.Progress() can push real-time updates to the browser
-demo.queue(max_size=1, default_concurrency_limit=1)
+# Enable queue so gr.Progress() can push real-time updates to the browser.
+# Video generation runs one job at a time on its own lane ("video_gen");
+# UI helpers and YouTube calls have separate lanes so they stay responsive.
+demo.queue(max_size=16, default_concurrency_limit=4)
 
 if __name__ == "__main__":
     demo.launch(
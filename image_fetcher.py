@@ -2,12 +2,18 @@
 Image fetcher - downloads free stock images from Pexels API
 """
 
+import io
 import os
+import re
 import random
-import requests
-import numpy as np
+import shutil
+import hashlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Dict, List, Optional, Union
 from urllib.parse import quote
 from PIL import Image
 
@@ -21,6 +27,43 @@ PIXABAY_API_URL = "https://pixabay.com/api/"
 # Fallback: Use Unsplash Source (no API key needed)
 UNSPLASH_SOURCE_URL = "https://source.unsplash.com"
 
+# Keyword image cache; kept outside TEMP_DIR, which is wiped after every video
+IMAGE_CACHE_DIR = Path(tempfile.gettempdir()) / "videogen_image_cache"
+IMAGE_CACHE_MAX_FILES = 200
+
+# Common keyword mappings for motivational content
+KEYWORD_MAPPINGS = {
+    "sleep": ["sleep", "bedroom", "night", "rest"],
+    "diet": ["healthy food", "nutrition", "vegetables", "kitchen"],
+    "room": ["clean room", "minimal room", "organized space"],
+    "mindset": ["brain", "thinking", "meditation", "focus"],
+    "discipline": ["workout", "training", "dedication", "routine"],
+    "chaos": ["storm", "chaos", "confusion", "mess"],
+    "life": ["lifestyle", "success", "motivation", "journey"],
+    "motivation": ["motivation", "inspiration", "goal", "achievement"],
+    "truth": ["truth", "wisdom", "knowledge", "insight"],
+    "basic": ["simple", "minimal", "foundation", "basics"],
+}
+_KEYWORD_PRIORITY = {key: i for i, key in enumerate(KEYWORD_MAPPINGS)}
+# Zero-width lookahead finds every (possibly overlapping) substring match in one pass
+_KEYWORD_RE = re.compile("(?=(" + "|".join(map(re.escape, KEYWORD_MAPPINGS)) + "))")
+
+
+@lru_cache(maxsize=8)
+def _gradient_image(width: int, height: int, color1: tuple, color2: tuple) -> Image.Image:
+    """Vertical color1 -> color2 gradient, built with NumPy broadcasting (cached per preset)"""
+    import numpy as np  # only needed for the fallback path
+    
+    ratio = (np.arange(height, dtype=np.float64) / height)[:, None]
+    rows = (
+        np.asarray(color1, dtype=np.float64) * (1 - ratio)
+        + np.asarray(color2, dtype=np.float64) * ratio
+    ).astype(np.uint8)
+    
+    gradient = np.empty((height, width, 3), dtype=np.uint8)
+    gradient[:] = rows[:, None, :]
+    return Image.fromarray(gradient)
+
 
 class ImageFetcher:
     def __init__(self, pexels_api_key: Optional[str] = None):
@@ -35,39 +78,80 @@ class ImageFetcher:
         self.temp_dir = Path(TEMP_DIR)
         self.temp_dir.mkdir(exist_ok=True)
         self.downloaded_images: List[str] = []
+        # Downloaded images keyed by keyword, reused across runs
+        self.cache_dir = IMAGE_CACHE_DIR
+        # Shared across download threads: keep-alive connection pool sized for
+        # the download workers, with retries on transient connection/5xx errors
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Unused Pexels search results grouped by the keyword's first word, so
+        # related keywords share one API call (up to 15 photos per search)
+        self._pexels_pool: Dict[str, List[dict]] = {}
+        self._pexels_locks: Dict[str, threading.Lock] = {}
+        self._pexels_pool_lock = threading.Lock()
     
     def search_and_download_images(
         self,
         keywords: List[str],
-        count: int = 5
-    ) -> List[str]:
+        count: int = 5,
+        in_memory: bool = False
+    ) -> List[Union[str, Image.Image]]:
         """
         Search and download images based on keywords.
         
         Args:
             keywords: List of search terms
             count: Number of images to download
+            in_memory: Return decoded PIL images instead of file paths (skips
+                       the temp-file write and re-read; save lazily if a path
+                       is needed later)
             
         Returns:
-            List of paths to downloaded images
+            List of paths to downloaded images (or PIL images when in_memory)
         """
         images = []
         attempted_keywords = set()
+        jobs = []
         
         for i, keyword in enumerate(keywords[:count]):
             if keyword in attempted_keywords:
                 continue
             attempted_keywords.add(keyword)
-            
-            print(f"  Fetching image for: {keyword}")
-            image_path = self._download_image(keyword, i)
-            if image_path:
-                images.append(image_path)
+            jobs.append((i, keyword))
+        
+        # Downloads are independent and I/O-bound: fetch them concurrently,
+        # then keep the results in keyword order
+        results = {}
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(len(jobs), 8)) as executor:
+                futures = {}
+                for i, keyword in jobs:
+                    print(f"  Fetching image for: {keyword}")
+                    futures[executor.submit(self._download_image, keyword, i, in_memory)] = i
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        
+        for i, _ in jobs:
+            if results.get(i):
+                images.append(results[i])
         
         # If we couldn't get any images, create gradient backgrounds
         if not images:
             print("      Creating gradient backgrounds as fallback...")
             for i in range(min(count, 5)):
+                if in_memory:
+                    images.append(self._gradient_fallback_image(i).copy())
+                    continue
                 gradient_path = self._create_gradient_fallback(i)
                 if gradient_path:
                     images.append(gradient_path)
@@ -75,51 +159,111 @@ class ImageFetcher:
         self.downloaded_images = images
         return images
     
-    def _download_image(self, keyword: str, index: int) -> Optional[str]:
-        """Download a single image"""
+    def _download_image(
+        self, keyword: str, index: int, in_memory: bool = False
+    ) -> Optional[Union[str, Image.Image]]:
+        """Download a single image (served from the keyword cache when possible)"""
         output_path = self.temp_dir / f"bg_image_{index}.jpg"
         
-        # Try Pexels first if we have API key
-        if self.pexels_api_key:
-            if self._download_from_pexels(keyword, output_path):
-                return str(output_path)
+        cache_key = hashlib.sha256(
+            f"{keyword}|{self.pexels_api_key is not None}".encode("utf-8")
+        ).hexdigest()[:16]
+        cached_path = self.cache_dir / f"{cache_key}.jpg"
+        try:
+            if in_memory:
+                img = Image.open(cached_path)
+                img.load()
+            else:
+                shutil.copyfile(cached_path, output_path)
+            os.utime(cached_path)  # mark as recently used
+            return img if in_memory else str(output_path)
+        except OSError:
+            pass
         
-        # Fallback to Unsplash Source (no API key needed)
-        if self._download_from_unsplash(keyword, output_path):
-            return str(output_path)
+        # Try Pexels first if we have API key, then fall back to Unsplash
+        # Source (no API key needed)
+        target = io.BytesIO() if in_memory else output_path
+        if (
+            (self.pexels_api_key and self._download_from_pexels(keyword, target))
+            or self._download_from_unsplash(keyword, target)
+        ):
+            self._store_in_cache(target, cached_path)
+            if not in_memory:
+                return str(output_path)
+            try:
+                target.seek(0)
+                img = Image.open(target)
+                img.load()
+                return img
+            except OSError as e:
+                print(f"    Image decode error: {e}")
         
         return None
     
-    def _download_from_pexels(self, keyword: str, output_path: Path) -> bool:
-        """Download from Pexels API"""
+    def _store_in_cache(self, image: Union[Path, io.BytesIO], cached_path: Path):
+        """Copy a downloaded image (file or buffer) into the cache, evicting least recently used files"""
         try:
-            headers = {"Authorization": self.pexels_api_key}
-            params = {
-                "query": keyword,
-                "per_page": 15,
-                "orientation": "portrait",  # Vertical for shorts
-                "size": "large"
-            }
-            
-            response = requests.get(PEXELS_API_URL, headers=headers, params=params, timeout=10)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cached_path.with_suffix(f".{threading.get_ident()}.tmp")
+            if isinstance(image, io.BytesIO):
+                with open(tmp_path, 'wb') as f:
+                    f.write(image.getbuffer())
+            else:
+                shutil.copyfile(image, tmp_path)
+            os.replace(tmp_path, cached_path)
             
-            if response.status_code == 200:
-                data = response.json()
-                photos = data.get("photos", [])
-                
-                if photos:
-                    # Pick a random photo from results
-                    photo = random.choice(photos)
-                    image_url = photo["src"]["portrait"]  # Vertical format
-                    
-                    return self._download_file(image_url, output_path)
+            with os.scandir(self.cache_dir) as entries:
+                cached = [(e.stat().st_mtime, e.path) for e in entries if e.name.endswith(".jpg")]
+            if len(cached) > IMAGE_CACHE_MAX_FILES:
+                cached.sort()
+                for _, path in cached[:len(cached) - IMAGE_CACHE_MAX_FILES]:
+                    os.unlink(path)
+        except OSError as e:
+            print(f"    Image cache error: {e}")
+    
+    def _download_from_pexels(self, keyword: str, output_path: Union[Path, BinaryIO]) -> bool:
+        """Download from Pexels API, drawing on pooled search results"""
+        try:
+            photo = self._next_pexels_photo(keyword)
+            if photo:
+                image_url = photo["src"]["portrait"]  # Vertical format
+                return self._download_file(image_url, output_path)
             
         except Exception as e:
             print(f"    Pexels error: {e}")
         
         return False
     
-    def _download_from_unsplash(self, keyword: str, output_path: Path) -> bool:
+    def _next_pexels_photo(self, keyword: str) -> Optional[dict]:
+        """Pop a random photo for keyword's group, searching Pexels only when the pool is empty"""
+        group = keyword.split()[0].lower() if keyword.strip() else keyword
+        with self._pexels_pool_lock:
+            group_lock = self._pexels_locks.setdefault(group, threading.Lock())
+        
+        # One search per group at a time; other workers wait and reuse its results
+        with group_lock:
+            pool = self._pexels_pool.get(group)
+            if not pool:
+                headers = {"Authorization": self.pexels_api_key}
+                params = {
+                    "query": keyword,
+                    "per_page": 15,
+                    "orientation": "portrait",  # Vertical for shorts
+                    "size": "large"
+                }
+                
+                response = self.session.get(PEXELS_API_URL, headers=headers, params=params, timeout=10)
+                if response.status_code != 200:
+                    return None
+                pool = response.json().get("photos", [])
+                self._pexels_pool[group] = pool
+            
+            if not pool:
+                return None
+            # Pick a random photo from results; popping keeps segments distinct
+            return pool.pop(random.randrange(len(pool)))
+    
+    def _download_from_unsplash(self, keyword: str, output_path: Union[Path, BinaryIO]) -> bool:
         """Download from Unsplash Source (no API key needed)"""
         try:
             # Unsplash Source URL format for specific size
@@ -133,15 +277,20 @@ class ImageFetcher:
         
         return False
     
-    def _download_file(self, url: str, output_path: Path) -> bool:
-        """Download file from URL"""
+    def _download_file(self, url: str, output_path: Union[Path, BinaryIO]) -> bool:
+        """Download file from URL to a path, or into a writable buffer (replacing its contents)"""
         try:
-            response = requests.get(url, timeout=30, stream=True)
-            
-            if response.status_code == 200:
-                with open(output_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                # Let the C-level copy loop stream the body in 1MB blocks
+                response.raw.decode_content = True
+                if isinstance(output_path, Path):
+                    with open(output_path, 'wb') as f:
+                        shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+                else:
+                    output_path.seek(0)
+                    output_path.truncate()
+                    shutil.copyfileobj(response.raw, output_path, length=1024 * 1024)
                 return True
                 
         except Exception as e:
@@ -151,6 +300,14 @@ class ImageFetcher:
     
     def _create_gradient_fallback(self, index: int) -> Optional[str]:
         """Create a gradient image as fallback"""
+        img = self._gradient_fallback_image(index)
+        output_path = self.temp_dir / f"gradient_bg_{index}.jpg"
+        img.save(output_path, format="JPEG", quality=85, subsampling=2, optimize=False)
+        
+        return str(output_path)
+    
+    def _gradient_fallback_image(self, index: int) -> Image.Image:
+        """Gradient fallback as a (shared, cached) PIL image"""
         # Different color combinations for variety
         gradients = [
             ((26, 26, 46), (15, 52, 96)),      # Dark blue
@@ -162,48 +319,23 @@ class ImageFetcher:
         
         color1, color2 = gradients[index % len(gradients)]
         
-        # Create gradient array
-        gradient = np.zeros((VIDEO_HEIGHT, VIDEO_WIDTH, 3), dtype=np.uint8)
-        
-        for y in range(VIDEO_HEIGHT):
-            ratio = y / VIDEO_HEIGHT
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            gradient[y, :] = [r, g, b]
-        
-        img = Image.fromarray(gradient)
-        output_path = self.temp_dir / f"gradient_bg_{index}.jpg"
-        img.save(output_path, quality=95)
-        
-        return str(output_path)
+        return _gradient_image(VIDEO_WIDTH, VIDEO_HEIGHT, color1, color2)
     
     def extract_keywords_from_script(self, segments) -> List[str]:
         """Extract relevant keywords from script segments for image search"""
         keywords = []
-        
-        # Common keyword mappings for motivational content
-        keyword_mappings = {
-            "sleep": ["sleep", "bedroom", "night", "rest"],
-            "diet": ["healthy food", "nutrition", "vegetables", "kitchen"],
-            "room": ["clean room", "minimal room", "organized space"],
-            "mindset": ["brain", "thinking", "meditation", "focus"],
-            "discipline": ["workout", "training", "dedication", "routine"],
-            "chaos": ["storm", "chaos", "confusion", "mess"],
-            "life": ["lifestyle", "success", "motivation", "journey"],
-            "motivation": ["motivation", "inspiration", "goal", "achievement"],
-            "truth": ["truth", "wisdom", "knowledge", "insight"],
-            "basic": ["simple", "minimal", "foundation", "basics"],
-        }
+        # Segment positions per matched mapping key, filled in one batch below
+        slots_by_key = {}
         
         for segment in segments:
             text_lower = segment.text.lower()
             
-            # Check for keyword matches
-            for key, search_terms in keyword_mappings.items():
-                if key in text_lower:
-                    keywords.append(random.choice(search_terms))
-                    break
+            # Check for keyword matches (earliest key in KEYWORD_MAPPINGS wins)
+            found = set(_KEYWORD_RE.findall(text_lower))
+            if found:
+                key = min(found, key=_KEYWORD_PRIORITY.__getitem__)
+                slots_by_key.setdefault(key, []).append(len(keywords))
+                keywords.append(None)
             else:
                 # Default keywords based on segment type
                 if segment.segment_type == 'hook':
@@ -213,6 +345,11 @@ class ImageFetcher:
                 else:
                     keywords.append("abstract dark minimal")
         
+        # One random.choices call per key instead of one random.choice per segment
+        for key, slots in slots_by_key.items():
+            for slot, term in zip(slots, random.choices(KEYWORD_MAPPINGS[key], k=len(slots))):
+                keywords[slot] = term
+        
         return keywords
 
 
@@ -223,25 +360,12 @@ def create_gradient_image(
     color2: tuple = (15, 52, 96)
 ) -> str:
     """Create a gradient image as fallback"""
-    from PIL import Image
-    import numpy as np
-    
-    # Create gradient array
-    gradient = np.zeros((height, width, 3), dtype=np.uint8)
-    
-    for y in range(height):
-        ratio = y / height
-        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-        gradient[y, :] = [r, g, b]
-    
-    img = Image.fromarray(gradient)
+    img = _gradient_image(width, height, tuple(color1), tuple(color2))
     
     temp_dir = Path(TEMP_DIR)
     temp_dir.mkdir(exist_ok=True)
     output_path = temp_dir / "gradient_bg.jpg"
-    img.save(output_path, quality=95)
+    img.save(output_path, format="JPEG", quality=85, subsampling=2, optimize=False)
     
     return str(output_path)
 
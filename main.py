@@ -20,7 +20,6 @@ import sys
 from pathlib import Path
 
 from script_parser import parse_script
-from video_generator import VideoGenerator
 
 
 def main():
@@ -49,6 +48,13 @@ def main():
         action="store_true",
         help="Don't use stock videos, use animated backgrounds only"
     )
+    parser.add_argument(
+        "--encoder",
+        type=str,
+        default="auto",
+        choices=["auto", "libx264", "h264_nvenc", "h264_qsv", "h264_videotoolbox"],
+        help="H.264 encoder (default: auto - hardware encoder when available, else libx264)"
+    )
     parser.add_argument(
         "--no-cleanup",
         action="store_true",
@@ -89,9 +95,12 @@ def main():
         print("\n⚠ No Pexels API key - using animated backgrounds")
         print("  Get free API key at: https://www.pexels.com/api/")
     
-    # Generate video
+    # Generate video (imported here so --help and input errors don't pay for
+    # loading moviepy and the media pipeline)
     print("\nStarting video generation...")
-    generator = VideoGenerator(pexels_api_key=pexels_key)
+    from video_generator import VideoGenerator
+    
+    generator = VideoGenerator(pexels_api_key=pexels_key, encoder=args.encoder)
     
     try:
         output_path = generator.generate_video(
@@ -4,15 +4,66 @@ Supports: Pixabay, GIPHY, Tenor, and more
 """
 
 import os
+import time
 import random
+import shutil
+import hashlib
+import itertools
+import subprocess
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
-from urllib.parse import quote
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import quote, urlencode, urlsplit
 
 from config import VIDEO_WIDTH, VIDEO_HEIGHT, TEMP_DIR
 
+# orjson parses the search payloads several times faster when installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+# Downloaded media keyed by URL, reused across runs and processes. Kept outside
+# TEMP_DIR (wiped after every video); least recently used files are evicted.
+MEDIA_CACHE_DIR = Path(tempfile.gettempdir()) / "videogen_media_cache"
+MEDIA_CACHE_MAX_FILES = 64
+
+
+def _ffmpeg_exe() -> str:
+    """ffmpeg bundled with imageio-ffmpeg (what MoviePy uses), else the one on PATH"""
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return "ffmpeg"
+
+
+def _ffmpeg_gif_to_mp4(gif_path: str) -> str:
+    """Convert a GIF to an H.264 MP4 next to it with one ffmpeg call.
+    
+    Module-level so it can run in worker processes. Raises on failure.
+    """
+    video_path = str(Path(gif_path).with_suffix(".mp4"))
+    cmd = [
+        _ffmpeg_exe(), "-y", "-loglevel", "error",
+        "-i", str(gif_path),
+        # yuv420p needs even dimensions
+        "-vf", "fps=24,scale=trunc(iw/2)*2:trunc(ih/2)*2",
+        "-c:v", "libx264", "-pix_fmt", "yuv420p",
+        "-movflags", "+faststart", "-an",
+        video_path,
+    ]
+    subprocess.run(cmd, check=True, capture_output=True)
+    return video_path
+
 
 class MultiSourceFetcher:
     """Fetches media from multiple free sources"""
@@ -23,6 +74,28 @@ class MultiSourceFetcher:
     GIPHY_API = "https://api.giphy.com/v1/gifs/search"
     TENOR_API = "https://tenor.googleapis.com/v2/search"
     
+    # Politeness limits: concurrent requests per host, and retries when a
+    # provider answers 429/503 (honouring Retry-After, else exponential backoff)
+    HOST_CONCURRENCY = 5
+    RATE_LIMIT_RETRIES = 3
+    MAX_BACKOFF = 30.0
+    
+    # Parallel file downloads per fetch call
+    DOWNLOAD_WORKERS = 5
+    
+    # Renditions larger than this are skipped in favour of a smaller one
+    MAX_MEDIA_BYTES = 25 * 1024 * 1024
+    
+    # Search responses reused for repeated queries (LRU with a freshness window)
+    SEARCH_CACHE_SIZE = 256
+    SEARCH_CACHE_TTL = 600  # seconds
+    
+    # fetch_mixed_media results remembered per (source, keyword, count)
+    FETCH_MEMO_SIZE = 128
+    
+    # Unique suffix for downloaded file names (shared by all instances)
+    _file_counter = itertools.count()
+    
     # Default search terms by mood
     MOOD_KEYWORDS = {
         "motivation": ["success", "winner", "achievement", "goal", "hustle"],
@@ -35,7 +108,16 @@ class MultiSourceFetcher:
     def __init__(self):
         self.temp_dir = Path(TEMP_DIR)
         self.temp_dir.mkdir(exist_ok=True)
+        # Keep-alive pool shared by the concurrent fetches; urllib3 retries
+        # connection errors and 5xx, while 429/503 backoff lives in _request
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[500, 502, 504]),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -47,6 +129,190 @@ class MultiSourceFetcher:
         
         # Track downloaded files to avoid duplicates
         self.downloaded_urls = set()
+        
+        # Per-host semaphores shared by the concurrent fetches
+        self._host_sems = {}
+        self._host_sems_lock = threading.Lock()
+        
+        # {(url, params): (timestamp, results)} for successful searches
+        self._search_cache = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        
+        # {(source, keyword, count): (paths...)} for fetch_mixed_media
+        self._fetch_memo = OrderedDict()
+        self._fetch_memo_lock = threading.Lock()
+    
+    def _host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).hostname or ""
+        with self._host_sems_lock:
+            sem = self._host_sems.get(host)
+            if sem is None:
+                sem = self._host_sems[host] = threading.BoundedSemaphore(self.HOST_CONCURRENCY)
+            return sem
+    
+    def _retry_delay(self, response, attempt: int) -> float:
+        """Seconds to wait before retrying a rate-limited request"""
+        try:
+            base = float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            base = 1.0  # missing or HTTP-date form
+        return min(base * 2 ** attempt, self.MAX_BACKOFF)
+    
+    @contextmanager
+    def _request(self, url: str, **kwargs):
+        """GET url holding one of its host's slots until the response is consumed.
+        
+        429/503 answers are retried up to RATE_LIMIT_RETRIES times; the slot is
+        released while backing off.
+        """
+        params = kwargs.pop("params", None)
+        if params:
+            # Encode the query string once; every retry reuses the same URL
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params, doseq=True)}"
+        get = self.session.get
+        sem = self._host_semaphore(url)
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            sem.acquire()
+            try:
+                response = get(url, **kwargs)
+            except BaseException:
+                sem.release()
+                raise
+            
+            if response.status_code in (429, 503) and attempt < self.RATE_LIMIT_RETRIES:
+                delay = self._retry_delay(response, attempt)
+                response.close()
+                sem.release()
+                print(f"      [{urlsplit(url).hostname}] HTTP {response.status_code}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            
+            try:
+                yield response
+            finally:
+                response.close()
+                sem.release()
+            return
+    
+    def _search(self, label: str, url: str, params: dict, list_key: str) -> Optional[list]:
+        """Run an API search and return its result list (None on API error).
+        
+        Successful responses are cached per (url, params), so the same query
+        from another call site within SEARCH_CACHE_TTL skips the round trip.
+        Returns a fresh list the caller may shuffle.
+        """
+        key = (url, tuple(sorted(params.items())))
+        now = time.monotonic()
+        with self._search_cache_lock:
+            cached = self._search_cache.get(key)
+            if cached is not None and now - cached[0] < self.SEARCH_CACHE_TTL:
+                self._search_cache.move_to_end(key)
+                print(f"      [{label}] Using cached results for: {params.get('q')}")
+                return list(cached[1])
+        
+        print(f"      [{label}] Searching for: {params.get('q')}")
+        with self._request(url, params=params, timeout=15) as response:
+            if response.status_code != 200:
+                print(f"      [{label}] API error: {response.status_code}")
+                return None
+            results = _json_loads(response.content).get(list_key, [])
+        
+        with self._search_cache_lock:
+            self._search_cache[key] = (now, tuple(results))
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return list(results)
+    
+    def _probe_size(self, url: str) -> Optional[int]:
+        """Content-Length from a HEAD request (None when unknown)"""
+        try:
+            with self._request_head(url) as response:
+                length = response.headers.get("Content-Length")
+                return int(length) if response.ok and length else None
+        except (requests.RequestException, ValueError):
+            return None
+    
+    @contextmanager
+    def _request_head(self, url: str):
+        with self._host_semaphore(url):
+            response = self.session.head(url, allow_redirects=True, timeout=5)
+            try:
+                yield response
+            finally:
+                response.close()
+    
+    def _pick_rendition(self, options) -> Optional[str]:
+        """First (url, size) option within MAX_MEDIA_BYTES, in preference order.
+        
+        Uses the size reported by the search API when present and only falls
+        back to a HEAD request when it isn't; unknown sizes are accepted.
+        """
+        for url, size in options:
+            if not url:
+                continue
+            try:
+                size = int(size) if size else None
+            except (TypeError, ValueError):
+                size = None
+            if size is None:
+                size = self._probe_size(url)
+            if size is None or size <= self.MAX_MEDIA_BYTES:
+                return url
+        return None
+    
+    def _page_size(self, count: int, limit: int, oversample: Optional[int] = None) -> int:
+        """How many search results to ask for when we need `count` items.
+        
+        Nothing has been downloaded yet on the first call, so there is nothing
+        to dedup against and `count` results are enough. Once downloaded_urls
+        has entries, ask for twice as many so repeats can be skipped.
+        """
+        if oversample is None:
+            oversample = 2 if self.downloaded_urls else 1
+        return max(1, min(count * oversample, limit))
+    
+    def _download_candidates(self, candidates: Iterable[Tuple[str, Path]], count: int) -> List[Tuple[str, Path]]:
+        """Download (url, output_path) candidates concurrently until count succeed.
+        
+        candidates may be a lazy generator: each one is pulled (and its download
+        started) as soon as a slot frees up, so the first download begins while
+        later picks are still being resolved. Spare candidates are only pulled
+        to replace failures. Successes keep candidate order.
+        """
+        done = {}
+        if count <= 0:
+            return []
+        
+        candidates = iter(candidates)
+        seen = set()
+        
+        def next_candidate():
+            for url, output_path in candidates:
+                if url not in seen:
+                    seen.add(url)
+                    return url, output_path
+            return None
+        
+        with ThreadPoolExecutor(max_workers=min(self.DOWNLOAD_WORKERS, count)) as executor:
+            in_flight = {}
+            order = 0
+            while True:
+                # Keep just enough downloads running to reach count
+                while len(in_flight) + len(done) < count:
+                    candidate = next_candidate()
+                    if candidate is None:
+                        break
+                    in_flight[executor.submit(self._download_file, *candidate)] = (order, candidate)
+                    order += 1
+                if not in_flight:
+                    break
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index, candidate = in_flight.pop(future)
+                    if future.result():
+                        done[index] = candidate
+        return [done[i] for i in sorted(done)]
     
     def fetch_from_pixabay(
         self,
@@ -76,7 +342,7 @@ class MultiSourceFetcher:
             params = {
                 "key": self.pixabay_key,
                 "q": query,
-                "per_page": min(count * 3, 50),  # Get more results for variety
+                "per_page": max(3, self._page_size(count, 50)),  # API minimum is 3
                 "safesearch": "true",
             }
             
@@ -86,16 +352,10 @@ class MultiSourceFetcher:
                 params["image_type"] = "photo"
                 params["orientation"] = orientation
             
-            print(f"      [Pixabay] Searching for: {query}")
-            response = self.session.get(api_url, params=params, timeout=15)
-            
-            if response.status_code != 200:
-                print(f"      [Pixabay] API error: {response.status_code}")
+            hits = self._search("Pixabay", api_url, params, "hits")
+            if hits is None:
                 return []
             
-            data = response.json()
-            hits = data.get("hits", [])
-            
             if not hits:
                 print(f"      [Pixabay] No results for: {query}")
                 return []
@@ -103,35 +363,32 @@ class MultiSourceFetcher:
             # Shuffle to get variety
             random.shuffle(hits)
             
-            for i, item in enumerate(hits[:count * 2]):  # Try more to account for failures
-                if len(downloaded) >= count:
-                    break
-                
-                if media_type == "video":
-                    # Get video URL (prefer medium quality for speed)
-                    videos = item.get("videos", {})
-                    video_url = (
-                        videos.get("medium", {}).get("url") or
-                        videos.get("small", {}).get("url") or
-                        videos.get("large", {}).get("url")
-                    )
+            def candidates():
+                # Picked lazily, so downloads start while later items are resolved
+                for i, item in enumerate(hits[:count * 2]):  # Try more to account for failures
+                    if media_type == "video":
+                        # Get video URL (prefer medium quality for speed)
+                        videos = item.get("videos", {})
+                        video_url = self._pick_rendition(
+                            (videos.get(quality, {}).get("url"), videos.get(quality, {}).get("size"))
+                            for quality in ("medium", "small", "large")
+                        )
                     
-                    if video_url and video_url not in self.downloaded_urls:
-                        output_path = self.temp_dir / f"pixabay_video_{i}_{random.randint(1000,9999)}.mp4"
-                        if self._download_file(video_url, output_path):
-                            downloaded.append(str(output_path))
-                            self.downloaded_urls.add(video_url)
-                            print(f"      [Pixabay] Downloaded video {len(downloaded)}/{count}")
-                else:
-                    # Get image URL
-                    image_url = item.get("largeImageURL") or item.get("webformatURL")
+                        if video_url and video_url not in self.downloaded_urls:
+                            output_path = self.temp_dir / f"pixabay_video_{i}_{next(self._file_counter)}.mp4"
+                            yield (video_url, output_path)
+                    else:
+                        # Get image URL
+                        image_url = item.get("largeImageURL") or item.get("webformatURL")
                     
-                    if image_url and image_url not in self.downloaded_urls:
-                        output_path = self.temp_dir / f"pixabay_image_{i}_{random.randint(1000,9999)}.jpg"
-                        if self._download_file(image_url, output_path):
-                            downloaded.append(str(output_path))
-                            self.downloaded_urls.add(image_url)
-                            print(f"      [Pixabay] Downloaded image {len(downloaded)}/{count}")
+                        if image_url and image_url not in self.downloaded_urls:
+                            output_path = self.temp_dir / f"pixabay_image_{i}_{next(self._file_counter)}.jpg"
+                            yield (image_url, output_path)
+            
+            for url, output_path in self._download_candidates(candidates(), count):
+                downloaded.append(str(output_path))
+                self.downloaded_urls.add(url)
+                print(f"      [Pixabay] Downloaded {media_type} {len(downloaded)}/{count}")
             
         except Exception as e:
             print(f"      [Pixabay] Error: {e}")
@@ -163,21 +420,15 @@ class MultiSourceFetcher:
             params = {
                 "api_key": api_key,
                 "q": query,
-                "limit": min(count * 3, 25),
+                "limit": self._page_size(count, 25),
                 "rating": "g",
                 "lang": "en"
             }
             
-            print(f"      [GIPHY] Searching for: {query}")
-            response = self.session.get(self.GIPHY_API, params=params, timeout=15)
-            
-            if response.status_code != 200:
-                print(f"      [GIPHY] API error: {response.status_code}")
+            gifs = self._search("GIPHY", self.GIPHY_API, params, "data")
+            if gifs is None:
                 return []
             
-            data = response.json()
-            gifs = data.get("data", [])
-            
             if not gifs:
                 print(f"      [GIPHY] No results for: {query}")
                 return []
@@ -185,36 +436,35 @@ class MultiSourceFetcher:
             # Shuffle for variety
             random.shuffle(gifs)
             
-            for i, gif in enumerate(gifs[:count * 2]):
-                if len(downloaded) >= count:
-                    break
-                
-                # Get MP4 version (better for video editing)
-                images = gif.get("images", {})
+            def candidates():
+                # Picked lazily, so downloads start while later items are resolved
+                for i, gif in enumerate(gifs[:count * 2]):
+                    # Get MP4 version (better for video editing)
+                    images = gif.get("images", {})
                 
-                # Prefer original_mp4 or downsized for quality
-                mp4_url = (
-                    images.get("original_mp4", {}).get("mp4") or
-                    images.get("downsized", {}).get("url") or
-                    images.get("original", {}).get("url")
-                )
+                    # Prefer original_mp4 or downsized for quality
+                    original_mp4 = images.get("original_mp4", {})
+                    downsized = images.get("downsized", {})
+                    original = images.get("original", {})
+                    mp4_url = self._pick_rendition((
+                        (original_mp4.get("mp4"), original_mp4.get("mp4_size")),
+                        (downsized.get("url"), downsized.get("size")),
+                        (original.get("url"), original.get("size")),
+                    ))
                 
-                if mp4_url and mp4_url not in self.downloaded_urls:
-                    ext = ".mp4" if ".mp4" in mp4_url else ".gif"
-                    output_path = self.temp_dir / f"giphy_{i}_{random.randint(1000,9999)}{ext}"
-                    
-                    if self._download_file(mp4_url, output_path):
-                        # Convert GIF to video if needed
-                        if ext == ".gif":
-                            video_path = self._convert_gif_to_video(output_path)
-                            if video_path:
-                                downloaded.append(video_path)
-                                self.downloaded_urls.add(mp4_url)
-                                print(f"      [GIPHY] Downloaded & converted GIF {len(downloaded)}/{count}")
-                        else:
-                            downloaded.append(str(output_path))
-                            self.downloaded_urls.add(mp4_url)
-                            print(f"      [GIPHY] Downloaded MP4 {len(downloaded)}/{count}")
+                    if mp4_url and mp4_url not in self.downloaded_urls:
+                        ext = ".mp4" if ".mp4" in mp4_url else ".gif"
+                        output_path = self.temp_dir / f"giphy_{i}_{next(self._file_counter)}{ext}"
+                        yield (mp4_url, output_path)
+            
+            # Convert GIFs to video if needed
+            fetched = self._convert_gifs(self._download_candidates(candidates(), count))
+            for mp4_url, video_path, was_gif in fetched:
+                if video_path:
+                    downloaded.append(video_path)
+                    self.downloaded_urls.add(mp4_url)
+                    kind = "& converted GIF" if was_gif else "MP4"
+                    print(f"      [GIPHY] Downloaded {kind} {len(downloaded)}/{count}")
             
         except Exception as e:
             print(f"      [GIPHY] Error: {e}")
@@ -243,71 +493,117 @@ class MultiSourceFetcher:
             params = {
                 "key": self.tenor_key,
                 "q": query,
-                "limit": min(count * 3, 20),
+                "limit": self._page_size(count, 20),
                 "contentfilter": "medium",
                 "media_filter": "mp4,gif"
             }
             
-            print(f"      [Tenor] Searching for: {query}")
-            response = self.session.get(self.TENOR_API, params=params, timeout=15)
-            
-            if response.status_code != 200:
-                print(f"      [Tenor] API error: {response.status_code}")
+            results = self._search("Tenor", self.TENOR_API, params, "results")
+            if results is None:
                 return []
             
-            data = response.json()
-            results = data.get("results", [])
-            
             if not results:
                 print(f"      [Tenor] No results for: {query}")
                 return []
             
             random.shuffle(results)
             
-            for i, item in enumerate(results[:count * 2]):
-                if len(downloaded) >= count:
-                    break
-                
-                media_formats = item.get("media_formats", {})
-                
-                # Prefer MP4
-                mp4_data = media_formats.get("mp4", {})
-                url = mp4_data.get("url")
+            def candidates():
+                # Picked lazily, so downloads start while later items are resolved
+                for i, item in enumerate(results[:count * 2]):
+                    media_formats = item.get("media_formats", {})
                 
-                if not url:
+                    # Prefer MP4
+                    mp4_data = media_formats.get("mp4", {})
                     gif_data = media_formats.get("gif", {})
-                    url = gif_data.get("url")
+                    url = self._pick_rendition((
+                        (mp4_data.get("url"), mp4_data.get("size")),
+                        (gif_data.get("url"), gif_data.get("size")),
+                    ))
                 
-                if url and url not in self.downloaded_urls:
-                    ext = ".mp4" if ".mp4" in url else ".gif"
-                    output_path = self.temp_dir / f"tenor_{i}_{random.randint(1000,9999)}{ext}"
-                    
-                    if self._download_file(url, output_path):
-                        if ext == ".gif":
-                            video_path = self._convert_gif_to_video(output_path)
-                            if video_path:
-                                downloaded.append(video_path)
-                                self.downloaded_urls.add(url)
-                        else:
-                            downloaded.append(str(output_path))
-                            self.downloaded_urls.add(url)
-                        print(f"      [Tenor] Downloaded {len(downloaded)}/{count}")
+                    if url and url not in self.downloaded_urls:
+                        ext = ".mp4" if ".mp4" in url else ".gif"
+                        output_path = self.temp_dir / f"tenor_{i}_{next(self._file_counter)}{ext}"
+                        yield (url, output_path)
+            
+            for url, video_path, _ in self._convert_gifs(self._download_candidates(candidates(), count)):
+                if video_path:
+                    downloaded.append(video_path)
+                    self.downloaded_urls.add(url)
+                print(f"      [Tenor] Downloaded {len(downloaded)}/{count}")
             
         except Exception as e:
             print(f"      [Tenor] Error: {e}")
         
         return downloaded
     
-    def _download_file(self, url: str, output_path: Path) -> bool:
-        """Download file from URL"""
+    def _media_cache_path(self, url: str, suffix: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        return MEDIA_CACHE_DIR / f"{key}{suffix}"
+    
+    def _link_or_copy(self, src: Path, dst: Path):
+        """Hard-link src to dst (no data copy), falling back to a copy across filesystems"""
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+    
+    def _store_in_media_cache(self, file_path: Path, cached_path: Path):
+        """Add a downloaded file to the media cache, evicting least recently used files"""
         try:
-            response = self.session.get(url, timeout=30, stream=True)
+            MEDIA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cached_path.with_name(f"{cached_path.name}.{threading.get_ident()}.tmp")
+            if tmp_path.exists():
+                tmp_path.unlink()
+            self._link_or_copy(file_path, tmp_path)
+            os.replace(tmp_path, cached_path)
             
-            if response.status_code == 200:
-                with open(output_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                return True
+            with os.scandir(MEDIA_CACHE_DIR) as entries:
+                cached = [(e.stat().st_mtime, e.path) for e in entries if not e.name.endswith(".tmp")]
+            if len(cached) > MEDIA_CACHE_MAX_FILES:
+                cached.sort()
+                for _, path in cached[:len(cached) - MEDIA_CACHE_MAX_FILES]:
+                    os.unlink(path)
+        except OSError as e:
+            print(f"      Media cache error: {e}")
+    
+    def _download_file(self, url: str, output_path: Path) -> bool:
+        """Download file from URL (served from the media cache when possible)"""
+        cached_path = self._media_cache_path(url, output_path.suffix)
+        try:
+            self._link_or_copy(cached_path, output_path)
+            os.utime(cached_path)  # mark as recently used
+            return True
+        except OSError:
+            pass
+        
+        try:
+            with self._request(url, timeout=30, stream=True) as response:
+                if response.status_code == 200:
+                    # Unbuffered fd writes in 256KB chunks; reserve the full
+                    # size up front when the server reports it
+                    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+                    try:
+                        total = int(response.headers.get("Content-Length") or 0)
+                        if total and hasattr(os, "posix_fallocate"):
+                            try:
+                                os.posix_fallocate(fd, 0, total)
+                            except OSError:
+                                pass  # not supported by this filesystem
+                        written = 0
+                        for chunk in response.iter_content(chunk_size=256 * 1024):
+                            view = memoryview(chunk)
+                            while view:
+                                n = os.write(fd, view)
+                                view = view[n:]
+                                written += n
+                        if total and written != total:
+                            # Compressed transfer (or short read): drop the reserved tail
+                            os.ftruncate(fd, written)
+                    finally:
+                        os.close(fd)
+                    self._store_in_media_cache(output_path, cached_path)
+                    return True
             
         except Exception as e:
             print(f"      Download error: {e}")
@@ -315,22 +611,9 @@ class MultiSourceFetcher:
         return False
     
     def _convert_gif_to_video(self, gif_path: Path) -> Optional[str]:
-        """Convert GIF to MP4 video using moviepy"""
+        """Convert GIF to MP4 video with a direct ffmpeg call"""
         try:
-            from moviepy.editor import VideoFileClip
-            
-            video_path = str(gif_path).replace('.gif', '.mp4')
-            
-            clip = VideoFileClip(str(gif_path))
-            clip.write_videofile(
-                video_path,
-                fps=24,
-                codec='libx264',
-                audio=False,
-                verbose=False,
-                logger=None
-            )
-            clip.close()
+            video_path = _ffmpeg_gif_to_mp4(str(gif_path))
             
             # Remove original GIF
             gif_path.unlink()
@@ -341,6 +624,47 @@ class MultiSourceFetcher:
             print(f"      GIF conversion error: {e}")
             return str(gif_path)  # Return GIF path as fallback
     
+    def _convert_gifs(self, items: List[Tuple[str, Path]]) -> List[Tuple[str, str, bool]]:
+        """Convert the GIFs among downloaded (url, path) items, all at once.
+        
+        Each conversion is an ffmpeg subprocess, so a thread pool is enough to
+        run them in parallel (one per core). Returns (url, final_path,
+        was_gif) in input order.
+        """
+        gifs = [path for _, path in items if path.suffix == ".gif"]
+        converted = {}
+        if gifs:
+            with ThreadPoolExecutor(max_workers=min(len(gifs), os.cpu_count() or 4)) as executor:
+                converted = dict(zip(gifs, executor.map(self._convert_gif_to_video, gifs)))
+        return [
+            (url, converted[path], True) if path in converted else (url, str(path), False)
+            for url, path in items
+        ]
+    
+    def _memo_fetch(self, source: str, fetch, keyword: str, count: int, *args) -> List[str]:
+        """Run fetch(keyword, *args, count) once per (source, keyword, count).
+        
+        Later calls reuse the remembered paths while they all still exist on
+        disk (TEMP_DIR is wiped between videos, which invalidates them).
+        """
+        key = (source, keyword, count)
+        with self._fetch_memo_lock:
+            paths = self._fetch_memo.get(key)
+            if paths is not None:
+                self._fetch_memo.move_to_end(key)
+        if paths and all(os.path.exists(p) for p in paths):
+            print(f"      [{source}] Reusing {len(paths)} items for: {keyword}")
+            return list(paths)
+        
+        paths = fetch(keyword, *args, count)
+        if paths:
+            with self._fetch_memo_lock:
+                self._fetch_memo[key] = tuple(paths)
+                self._fetch_memo.move_to_end(key)
+                while len(self._fetch_memo) > self.FETCH_MEMO_SIZE:
+                    self._fetch_memo.popitem(last=False)
+        return paths
+    
     def fetch_mixed_media(
         self,
         keywords: List[str],
@@ -358,19 +682,29 @@ class MultiSourceFetcher:
         # Distribute requests across sources
         per_source = max(1, count // 3)
         
-        # Try each source
-        for i, keyword in enumerate(keywords[:3]):
-            if i == 0 and self.pixabay_key:
-                media = self.fetch_from_pixabay(keyword, "video", per_source)
-                all_media.extend(media)
-            elif i == 1:
-                media = self.fetch_hand_drawn_gifs(keyword, per_source)
-                all_media.extend(media)
-            elif i == 2 and self.tenor_key:
-                media = self.fetch_from_tenor(keyword, per_source)
-                all_media.extend(media)
-        
-        # Fill remaining with GIPHY (most accessible)
+        # Each source is a different host and the work is pure network I/O, so
+        # query them concurrently; results are kept in source order
+        # (label, enabled, fetcher, extra args); enabled sources take the
+        # keywords in order
+        sources = [
+            ("Pixabay", bool(self.pixabay_key), self.fetch_from_pixabay, ("video",)),
+            ("GIPHY", True, self.fetch_hand_drawn_gifs, ()),
+            ("Tenor", bool(self.tenor_key), self.fetch_from_tenor, ()),
+        ]
+        enabled = [source for source in sources if source[1]]
+        jobs = [
+            (label, fetch, keyword, per_source, *args)
+            for (label, _, fetch, args), keyword in zip(enabled, keywords)
+        ]
+        
+        if jobs:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = [executor.submit(self._memo_fetch, *job) for job in jobs]
+                for future in futures:
+                    all_media.extend(future.result())
+        
+        # Fill remaining with GIPHY (most accessible); not memoized, since it
+        # must return items beyond the ones already picked
         remaining = count - len(all_media)
         if remaining > 0 and len(keywords) > 0:
             extra = self.fetch_hand_drawn_gifs(keywords[-1], remaining)
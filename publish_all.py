@@ -5,7 +5,7 @@ Generates and publishes YouTube Shorts in ALL languages, ONE AT A TIME.
 
 This script:
 1. Iterates over all folders in youtubeshorts/
-2. Generates video for ONE language at a time
+2. Generates video for ONE language at a time (or K at a time with --parallel)
 3. Publishes it to YouTube
 4. Waits for completion
 5. Moves to next language/folder
@@ -14,41 +14,143 @@ Usage:
     python publish_all.py ssoni                    # All folders, all languages
     python publish_all.py ssoni "Hindi,Kannada"   # All folders, specific languages
     python publish_all.py ssoni --folder "motivation"  # Specific folder only
+    python publish_all.py ssoni --parallel 3       # Up to 3 languages at once
+    python publish_all.py ssoni --uploaders 1      # Upload while the next one renders
 """
 
+import argparse
 import subprocess
 import sys
 import os
+import re
 import time
-import signal
-from datetime import datetime
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from types import MappingProxyType
 
-# Ignore SIGINT during processing
-signal.signal(signal.SIGINT, signal.SIG_IGN)
-
-# All supported languages
-ALL_LANGUAGES = [
-    "English",
-    "Hindi", 
-    "Kannada",
-    "Spanish",
-    "French",
-    "German",
-    "Portuguese",
-    "Italian",
-    "Japanese",
-    "Korean",
-    "Chinese",
-    "Arabic",
-    "Russian",
-    "Dutch",
-    "Turkish",
-    "Polish",
-    "Vietnamese",
-    "Thai",
-    "Indonesian"
-]
+# All supported languages and their video file suffixes
+_LANG_CODE = MappingProxyType({
+    "English": "en", "Hindi": "hi", "Kannada": "kn", "Spanish": "es",
+    "French": "fr", "German": "de", "Portuguese": "pt", "Italian": "it",
+    "Japanese": "ja", "Korean": "ko", "Chinese": "zh", "Arabic": "ar",
+    "Russian": "ru", "Dutch": "nl", "Turkish": "tr", "Polish": "pl",
+    "Vietnamese": "vi", "Thai": "th", "Indonesian": "id"
+})
+ALL_LANGUAGES = tuple(_LANG_CODE)
+
+
+# Minimum gap between two uploads starting on the same YouTube account
+UPLOAD_INTERVAL = 5  # seconds
+
+# Serializes output from concurrent tasks so lines don't interleave
+_print_lock = threading.Lock()
+
+# {account: monotonic time at which the next task may start}
+_next_start = {}
+_next_start_lock = threading.Lock()
+
+
+def format_hms(seconds: float) -> str:
+    """Format a duration as H:MM:SS."""
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def log(message: str = ""):
+    """Print a message without interleaving with other tasks."""
+    with _print_lock:
+        print(message, flush=True)
+
+
+def log_raw(prefix: str, lines):
+    """Pass a child's output lines through as bytes, in one write."""
+    lead = prefix.encode() + b"  "
+    data = b"".join(lead + line.rstrip() + b"\n" for line in lines)
+    out = sys.stdout.buffer
+    with _print_lock:
+        out.write(data)
+        out.flush()
+
+
+def read_line_batches(stream):
+    """Yield the complete lines from each read of a binary pipe.
+    
+    read1() returns whatever the child has written so far, so a burst of
+    output comes back as one batch without waiting for more to arrive.
+    """
+    pending = b""
+    while True:
+        chunk = stream.read1(65536)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        if lines:
+            yield lines
+    if pending:
+        yield [pending]
+
+
+# Optional comma-separated PEXELS_API_KEYS, handed out round-robin so
+# parallel children don't all draw on one key's rate limit
+_PEXELS_KEYS = [k.strip() for k in os.environ.get("PEXELS_API_KEYS", "").split(",") if k.strip()]
+_pexels_key_index = 0
+_pexels_key_lock = threading.Lock()
+
+# Published video link as printed by batch_video_generator.py
+_URL_RE = re.compile(rb'https://youtube\.com/shorts/[\w-]+')
+
+# Child output lines kept in --quiet mode, shown only if the run fails
+QUIET_TAIL_LINES = 20
+
+# Running children, so Ctrl-C can stop them instead of leaving them orphaned
+_children = set()
+_children_lock = threading.Lock()
+_stopping = threading.Event()
+
+# How long interrupted children get to exit before they are killed
+STOP_GRACE = 10  # seconds
+
+# Hard limit on one language run, output streaming included
+PROCESS_TIMEOUT = 900  # 15 minutes
+
+
+def stop_children():
+    """Stop all running children and keep new ones from starting."""
+    with _children_lock:
+        _stopping.set()
+        processes = list(_children)
+    
+    # batch_video_generator ignores SIGINT by design, so ask with terminate()
+    # (SIGTERM / TerminateProcess); whatever is still running once the shared
+    # grace period is over gets killed
+    for process in processes:
+        try:
+            process.terminate()
+        except OSError:
+            pass
+    
+    deadline = time.monotonic() + STOP_GRACE
+    for process in processes:
+        try:
+            process.wait(timeout=max(0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+def wait_for_upload_slot(account: str):
+    """Space task starts UPLOAD_INTERVAL seconds apart per account."""
+    with _next_start_lock:
+        now = time.monotonic()
+        start = max(now, _next_start.get(account, now))
+        _next_start[account] = start + UPLOAD_INTERVAL
+    if start > now:
+        time.sleep(start - now)
+
+
+# Files a folder needs before it can be published
+REQUIRED_FILES = frozenset({"script.txt", "metadata.txt", "youtube_publish.txt"})
 
 
 def get_all_folders() -> list:
@@ -60,36 +162,90 @@ def get_all_folders() -> list:
         return []
     
     folders = []
-    for item in youtubeshorts_dir.iterdir():
-        if item.is_dir():
-            # Check if it has required files
-            has_script = (item / "script.txt").exists()
-            has_metadata = (item / "metadata.txt").exists()
-            has_youtube = (item / "youtube_publish.txt").exists()
-            
-            if has_script and has_metadata and has_youtube:
-                folders.append(item.name)
+    with os.scandir(youtubeshorts_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            # One directory listing instead of a stat per required file
+            with os.scandir(entry.path) as files:
+                names = {f.name for f in files}
+            if REQUIRED_FILES <= names:
+                folders.append(entry.name)
     
     return sorted(folders)
 
 
 def get_video_path(folder: str, language: str) -> Path:
     """Get the expected video path for a language."""
-    lang_codes = {
-        "English": "en", "Hindi": "hi", "Kannada": "kn", "Spanish": "es",
-        "French": "fr", "German": "de", "Portuguese": "pt", "Italian": "it",
-        "Japanese": "ja", "Korean": "ko", "Chinese": "zh", "Arabic": "ar",
-        "Russian": "ru", "Dutch": "nl", "Turkish": "tr", "Polish": "pl",
-        "Vietnamese": "vi", "Thai": "th", "Indonesian": "id"
-    }
-    code = lang_codes.get(language, language.lower()[:2])
+    code = _LANG_CODE.get(language, language.lower()[:2])
     script_dir = Path(__file__).parent
     return script_dir / "youtubeshorts" / folder / f"{folder}_{code}.mp4"
 
 
-def process_single_language(folder: str, language: str, account: str) -> dict:
+def next_pexels_key() -> str:
+    """Next key from PEXELS_API_KEYS, or "" when none are configured."""
+    global _pexels_key_index
+    if not _PEXELS_KEYS:
+        return ""
+    with _pexels_key_lock:
+        key = _PEXELS_KEYS[_pexels_key_index % len(_PEXELS_KEYS)]
+        _pexels_key_index += 1
+    return key
+
+
+def published_marker(video_path: Path) -> Path:
+    """File recording that video_path was uploaded (holds the Shorts URL)."""
+    return video_path.with_name(video_path.name + ".published")
+
+
+def mark_published(video_path: Path, youtube_url: str = None):
+    """Record a successful upload of video_path."""
+    published_marker(video_path).write_text(youtube_url or "", encoding="utf-8")
+
+
+def is_up_to_date(video_path: Path) -> bool:
+    """True when the video was published after its script.txt last changed.
+    
+    A rendered mp4 alone doesn't count: its upload may have failed.
+    """
+    try:
+        script_mtime = (video_path.parent / "script.txt").stat().st_mtime
+        return published_marker(video_path).stat().st_mtime >= script_mtime
+    except OSError:
+        return False
+
+
+def build_base_cmd(account: str, publish: bool = True) -> list:
+    """Command shared by every language run; only --folder/--languages vary.
+    
+    Without publish the child only renders. Run again with publish, it finds
+    the rendered file and just uploads it.
+    """
+    if not publish:
+        return [sys.executable, "batch_video_generator.py"]
+    return [
+        sys.executable,
+        "batch_video_generator.py",
+        "--publish",
+        "--account", account
+    ]
+
+
+def process_single_language(
+    folder: str,
+    language: str,
+    base_cmd: list,
+    prefix: str = "",
+    force: bool = False,
+    quiet: bool = False
+) -> dict:
     """
     Process a single language - generate video and publish to YouTube.
+    base_cmd comes from build_base_cmd(); output lines from the child are
+    prefixed with `prefix`, or held back unless the run fails when quiet.
+    A video published after script.txt last changed was done by an earlier
+    run and is skipped ("cached"). force clears that record so the existing
+    render is published again (the child only renders a missing mp4).
     Returns dict with status and details.
     """
     result = {
@@ -103,52 +259,90 @@ def process_single_language(folder: str, language: str, account: str) -> dict:
     video_path = get_video_path(folder, language)
     result["video_path"] = str(video_path)
     
-    cmd = [
-        sys.executable,
-        "batch_video_generator.py",
-        "--folder", folder,
-        "--languages", language,
-        "--publish",
-        "--account", account
-    ]
+    if force:
+        published_marker(video_path).unlink(missing_ok=True)
+    elif is_up_to_date(video_path):
+        log(f"\n{prefix}  Already published: {video_path.name} (use --force to republish)")
+        result["status"] = "cached"
+        return result
+    
+    cmd = [*base_cmd, "--folder", folder, "--languages", language]
+    
+    log(f"\n{prefix}  Running: {' '.join(cmd[1:])}")
     
-    print(f"\n  Running: {' '.join(cmd[1:])}")
+    # Each child gets its own TEMP_DIR: the generator wipes it when done,
+    # which would pull files out from under a concurrent run
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ)
+    env["TEMP_DIR"] = f"{os.environ.get('TEMP_DIR', 'temp')}_{video_path.stem}"
+    pexels_key = next_pexels_key()
+    if pexels_key:
+        env["PEXELS_API_KEY"] = pexels_key
+    # Unbuffered child so progress lines arrive as they are printed
+    env["PYTHONUNBUFFERED"] = "1"
     
     try:
-        # Run subprocess and capture output
-        process = subprocess.Popen(
-            cmd,
-            cwd=os.path.dirname(os.path.abspath(__file__)),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
-        )
+        # Run subprocess and capture output as raw bytes; lines are passed
+        # through without a decode/encode round trip
+        with _children_lock:
+            if _stopping.is_set():
+                result["status"] = "cancelled"
+                return result
+            process = subprocess.Popen(
+                cmd,
+                cwd=script_dir,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT
+            )
+            _children.add(process)
+        
+        # The deadline covers the whole run: a child that hangs while holding
+        # stdout open is killed, which ends the read loop below
+        timed_out = threading.Event()
+        
+        def kill_on_deadline():
+            timed_out.set()
+            process.kill()
         
-        # Stream output in real-time
+        deadline = threading.Timer(PROCESS_TIMEOUT, kill_on_deadline)
+        deadline.daemon = True
+        deadline.start()
+        
+        # Stream output in real-time (or just keep the tail when quiet)
         youtube_url = None
-        for line in process.stdout:
-            print(f"  {line.rstrip()}")
-            # Capture YouTube URL from output
-            if "youtube.com/shorts/" in line:
-                import re
-                match = re.search(r'https://youtube\.com/shorts/[\w-]+', line)
-                if match:
-                    youtube_url = match.group(0)
+        tail = deque(maxlen=QUIET_TAIL_LINES)
+        try:
+            for lines in read_line_batches(process.stdout):
+                if quiet:
+                    tail.extend(lines)
+                else:
+                    log_raw(prefix, lines)
+                # Capture YouTube URL from output
+                for line in lines:
+                    if b"youtube.com/shorts/" in line:
+                        match = _URL_RE.search(line)
+                        if match:
+                            youtube_url = match.group(0).decode()
+            process.wait()
+        finally:
+            deadline.cancel()
+            with _children_lock:
+                _children.discard(process)
         
-        process.wait(timeout=900)  # 15 minutes max
+        if tail and (timed_out.is_set() or process.returncode != 0):
+            log_raw(prefix, tail)
         
-        if process.returncode == 0:
+        if timed_out.is_set():
+            result["status"] = "timeout"
+            result["error"] = "Exceeded 15 minutes"
+        elif process.returncode == 0:
             result["status"] = "success"
             result["youtube_url"] = youtube_url
         else:
             result["status"] = "failed"
             result["error"] = f"Exit code {process.returncode}"
             
-    except subprocess.TimeoutExpired:
-        process.kill()
-        result["status"] = "timeout"
-        result["error"] = "Exceeded 15 minutes"
     except Exception as e:
         result["status"] = "error"
         result["error"] = str(e)
@@ -157,32 +351,68 @@ def process_single_language(folder: str, language: str, account: str) -> dict:
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python publish_all.py <account> [languages] [--folder <name>]")
-        print()
-        print("Examples:")
-        print('  python publish_all.py ssoni                     # All folders, all languages')
-        print('  python publish_all.py ssoni "Hindi,Kannada"    # All folders, specific languages')
-        print('  python publish_all.py ssoni --folder motivation # Specific folder only')
-        print()
-        print("Available languages:", ", ".join(ALL_LANGUAGES))
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Generate and publish YouTube Shorts in all languages",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="\n".join([
+            "Examples:",
+            '  python publish_all.py ssoni                     # All folders, all languages',
+            '  python publish_all.py ssoni "Hindi,Kannada"    # All folders, specific languages',
+            '  python publish_all.py ssoni --folder motivation # Specific folder only',
+            '  python publish_all.py ssoni --parallel 3        # Up to 3 videos at once',
+            '  python publish_all.py ssoni --uploaders 1       # Upload while the next one renders',
+            "",
+            "Available languages: " + ", ".join(ALL_LANGUAGES),
+        ])
+    )
+    parser.add_argument(
+        "account",
+        help="YouTube account name to publish with"
+    )
+    parser.add_argument(
+        "languages",
+        nargs="?",
+        help="Comma-separated list of languages (default: all)"
+    )
+    parser.add_argument(
+        "--folder",
+        help="Process only a specific folder name"
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Number of languages to process at once (default: 1)"
+    )
+    parser.add_argument(
+        "--uploaders",
+        type=int,
+        default=0,
+        help="Render and upload as separate stages, with this many uploads "
+             "running alongside the --parallel renders (default: 0, one stage)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Republish the existing render of languages that are already published"
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Hide generator output except for failed runs"
+    )
+    args = parser.parse_args()
     
-    account = sys.argv[1]
-    languages = ALL_LANGUAGES
-    specific_folder = None
-    
-    # Parse arguments
-    i = 2
-    while i < len(sys.argv):
-        if sys.argv[i] == "--folder" and i + 1 < len(sys.argv):
-            specific_folder = sys.argv[i + 1]
-            i += 2
-        elif not sys.argv[i].startswith("--"):
-            languages = [lang.strip() for lang in sys.argv[i].split(",")]
-            i += 1
-        else:
-            i += 1
+    account = args.account
+    if args.languages:
+        languages = [lang.strip() for lang in args.languages.split(",")]
+    else:
+        languages = ALL_LANGUAGES
+    specific_folder = args.folder
+    parallel = max(1, args.parallel)
+    uploaders = max(0, args.uploaders)
+    base_cmd = build_base_cmd(account, publish=not uploaders)
+    upload_cmd = build_base_cmd(account)
     
     # Get folders to process
     if specific_folder:
@@ -203,69 +433,142 @@ def main():
     for f in folders:
         print(f"           - {f}")
     print(f"Languages: {len(languages)}")
-    print(f"Mode:      ONE AT A TIME (sequential)")
+    if uploaders:
+        print(f"Mode:      {parallel} RENDERING + {uploaders} UPLOADING (pipelined)")
+    elif parallel > 1:
+        print(f"Mode:      {parallel} AT A TIME (parallel)")
+    else:
+        print(f"Mode:      ONE AT A TIME (sequential)")
     print(f"Total:     {len(folders) * len(languages)} videos")
     print("=" * 60)
     
-    all_results = {}
-    start_time = datetime.now()
-    total_videos = len(folders) * len(languages)
-    current_video = 0
+    all_results = {folder: [None] * len(languages) for folder in folders}
+    start_time = time.perf_counter()
+    tasks = [
+        (folder, index, language)
+        for folder in folders
+        for index, language in enumerate(languages)
+    ]
+    total_videos = len(tasks)
+    started = 0
+    started_lock = threading.Lock()
     
-    for folder in folders:
-        print()
-        print("#" * 60)
-        print(f"FOLDER: {folder}")
-        print("#" * 60)
+    def run_task(folder: str, language: str) -> dict:
+        nonlocal started
+        # Space out starts per account to stay clear of YouTube rate limits
+        # (render-only runs don't touch YouTube)
+        if not uploaders and (args.force or not is_up_to_date(get_video_path(folder, language))):
+            wait_for_upload_slot(account)
+        with started_lock:
+            started += 1
+            current_video = started
+        prefix = f"[{folder}/{language}]" if parallel > 1 or uploaders else ""
+        log()
+        log("=" * 60)
+        log(f"[{current_video}/{total_videos}] {folder} - {language.upper()}")
+        log("=" * 60)
         
-        all_results[folder] = []
+        video_path = get_video_path(folder, language)
+        lang_start = time.perf_counter()
+        result = process_single_language(
+            folder, language, base_cmd, prefix, args.force, args.quiet
+        )
+        result["elapsed"] = time.perf_counter() - lang_start
+        result["folder"] = folder
+        if result["status"] == "success":
+            if uploaders:
+                # Only queue an upload for a file that exists; otherwise the
+                # upload child would quietly render it on the upload lane
+                if video_path.exists():
+                    result["status"] = "rendered"
+                else:
+                    result["status"] = "failed"
+                    result["error"] = "Render finished but no video was written"
+            elif result["youtube_url"]:
+                # The child exits 0 even when its upload failed; only a
+                # printed Shorts URL proves the video went up
+                mark_published(video_path, result["youtube_url"])
+        return result
+    
+    def run_upload(folder: str, rendered: dict) -> dict:
+        language = rendered["language"]
+        wait_for_upload_slot(account)
+        log(f"\n  Uploading {folder}/{language}...")
         
-        for language in languages:
-            current_video += 1
-            print()
-            print("=" * 60)
-            print(f"[{current_video}/{total_videos}] {folder} - {language.upper()}")
-            print("=" * 60)
-            
-            lang_start = datetime.now()
-            result = process_single_language(folder, language, account)
-            lang_duration = datetime.now() - lang_start
-            
-            result["duration"] = str(lang_duration).split('.')[0]
-            result["folder"] = folder
-            all_results[folder].append(result)
-            
-            # Print status
-            if result["status"] == "success":
-                print(f"\n  [OK] {language}: SUCCESS ({result['duration']})")
-                if result["youtube_url"]:
-                    print(f"    URL: {result['youtube_url']}")
-            else:
-                print(f"\n  [FAIL] {language}: {result['status'].upper()}")
-                if result["error"]:
-                    print(f"    Error: {result['error']}")
-            
-            # Small delay between videos to avoid rate limiting
-            if current_video < total_videos:
-                print("\n  Waiting 5 seconds before next video...")
-                time.sleep(5)
+        upload_start = time.perf_counter()
+        # The video was just rendered, so skip the up-to-date check
+        result = process_single_language(
+            folder, language, upload_cmd, f"[{folder}/{language}]", True, args.quiet
+        )
+        result["elapsed"] = rendered["elapsed"] + (time.perf_counter() - upload_start)
+        result["folder"] = folder
+        # The rendered mp4 alone doesn't count as done; record the upload so
+        # a failed or interrupted one is retried next run
+        if result["status"] == "success" and result["youtube_url"]:
+            mark_published(get_video_path(folder, language), result["youtube_url"])
+        return result
+    
+    with ThreadPoolExecutor(max_workers=parallel) as executor, \
+            ThreadPoolExecutor(max_workers=max(1, uploaders)) as upload_executor:
+        pending = {
+            executor.submit(run_task, folder, language): (folder, index)
+            for folder, index, language in tasks
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder, index = pending.pop(future)
+                    result = future.result()
+                    language = result["language"]
+                    
+                    # Rendered in pipelined mode: hand it to the uploaders
+                    # and let this render slot move on to the next video
+                    if result["status"] == "rendered":
+                        log(f"\n  [RENDERED] {folder}/{language}, queued for upload")
+                        pending[upload_executor.submit(run_upload, folder, result)] = (folder, index)
+                        continue
+                    
+                    result["duration"] = format_hms(result.pop("elapsed"))
+                    all_results[folder][index] = result
+                    
+                    # Print status
+                    if result["status"] == "success":
+                        log(f"\n  [OK] {folder}/{language}: SUCCESS ({result['duration']})")
+                        if result["youtube_url"]:
+                            log(f"    URL: {result['youtube_url']}")
+                    elif result["status"] == "cached":
+                        log(f"\n  [CACHED] {folder}/{language}: already published")
+                    else:
+                        log(f"\n  [FAIL] {folder}/{language}: {result['status'].upper()}")
+                        if result["error"]:
+                            log(f"    Error: {result['error']}")
+        except KeyboardInterrupt:
+            log("\nInterrupted - stopping running videos...")
+            executor.shutdown(wait=False, cancel_futures=True)
+            upload_executor.shutdown(wait=False, cancel_futures=True)
+            stop_children()
+            raise
     
     # Final Summary
-    total_duration = datetime.now() - start_time
+    total_duration = time.perf_counter() - start_time
     
     print()
     print("=" * 60)
     print("FINAL SUMMARY")
     print("=" * 60)
-    print(f"Total Duration: {str(total_duration).split('.')[0]}")
+    print(f"Total Duration: {format_hms(total_duration)}")
     
     total_success = 0
+    total_cached = 0
     total_failed = 0
     
     for folder, results in all_results.items():
         success = [r for r in results if r["status"] == "success"]
-        failed = [r for r in results if r["status"] != "success"]
+        cached = [r for r in results if r["status"] == "cached"]
+        failed = [r for r in results if r["status"] not in ("success", "cached")]
         total_success += len(success)
+        total_cached += len(cached)
         total_failed += len(failed)
         
         print(f"\n{folder}:")
@@ -274,14 +577,20 @@ def main():
             for r in success:
                 url = r.get("youtube_url", "N/A")
                 print(f"    [OK] {r['language']}: {url}")
+        if cached:
+            for r in cached:
+                print(f"    [CACHED] {r['language']}: {r['video_path']}")
         if failed:
             for r in failed:
                 print(f"    [FAIL] {r['language']}: {r.get('error', r['status'])}")    
     print()
-    print(f"TOTAL: {total_success} success, {total_failed} failed")
+    print(f"TOTAL: {total_success} success, {total_cached} cached, {total_failed} failed")
     print()
     print("Done!")
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except KeyboardInterrupt:
+        sys.exit(130)
@@ -21,19 +21,30 @@ def main():
     print("=" * 60)
     
     # Configuration
-    PEXELS_API_KEY = "iHd7xRYSd17iBTtVYecT4519k88ZMCYPmLWRrM6Sg2dy22EMdkoVQk0i"
+    PEXELS_API_KEY = os.environ.get("PEXELS_API_KEY")
     SCRIPT_FILE = "scripts/example_script.txt"
     OUTPUT_FILE = "output/my_short.mp4"
     
+    # --no-open skips opening the output folder when done
+    args = [arg for arg in sys.argv[1:] if arg != "--no-open"]
+    open_output = len(args) == len(sys.argv) - 1
+    
     # Check for custom script file
-    if len(sys.argv) > 1:
-        SCRIPT_FILE = sys.argv[1]
+    if len(args) > 0:
+        SCRIPT_FILE = args[0]
     
-    if len(sys.argv) > 2:
-        OUTPUT_FILE = sys.argv[2]
+    if len(args) > 1:
+        OUTPUT_FILE = args[1]
     
     script_path = project_dir / SCRIPT_FILE
     
+    if not PEXELS_API_KEY:
+        print("\n❌ PEXELS_API_KEY is not set")
+        print("   Get a free key at https://www.pexels.com/api/ and set it first:")
+        print("   set PEXELS_API_KEY=your_api_key")
+        input("\nPress Enter to exit...")
+        return
+    
     # Check if script exists
     if not script_path.exists():
         print(f"\n❌ Script file not found: {script_path}")
@@ -70,8 +81,6 @@ Follow for more!""")
     for seg in segments:
         print(f"   • {seg.segment_type}: {len(seg.display_lines)} lines")
     
-    # Set API key
-    os.environ["PEXELS_API_KEY"] = PEXELS_API_KEY
     print(f"\n🎬 Using Pexels stock videos")
     
     # Generate video
@@ -80,6 +89,7 @@ Follow for more!""")
     
     generator = VideoGenerator(pexels_api_key=PEXELS_API_KEY)
     
+    output_path = None
     try:
         output_path = generator.generate_video(
             segments,
@@ -92,11 +102,6 @@ Follow for more!""")
         print(f"  📁 Saved to: {output_path}")
         print("=" * 60)
         
-        # Open output folder
-        output_dir = project_dir / "output"
-        print(f"\n📂 Opening output folder...")
-        os.startfile(str(output_dir))
-        
     except Exception as e:
         print(f"\n❌ Error: {e}")
         import traceback
@@ -105,6 +110,13 @@ Follow for more!""")
     finally:
         generator.cleanup_temp_files()
     
+    # Open output folder (Explorer only exists on Windows, and only when
+    # someone is at the console to see it)
+    if output_path and open_output and sys.platform == "win32" and sys.stdout.isatty():
+        output_dir = project_dir / "output"
+        print(f"\n📂 Opening output folder...")
+        os.startfile(str(output_dir))
+    
     input("\nPress Enter to exit...")
 
 
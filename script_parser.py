@@ -3,16 +3,37 @@ Script parser for converting text scripts into structured segments
 """
 
 import re
+import sys
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 
-@dataclass
+# Section header words, header lines and sentence breaks
+_SECTION_START_RE = re.compile(r'Hook|Core|End', re.IGNORECASE)
+_HEADER_RE = re.compile(r'^(?:Hook|Core|End).*?:\s*\n?', re.IGNORECASE)
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Segment types, shared by every parsed segment
+HOOK = sys.intern('hook')
+CORE = sys.intern('core')
+CTA = sys.intern('cta')
+
+# __slots__ drops the per-instance __dict__ (dataclass slots need 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ScriptSegment:
     """Represents a segment of the script"""
-    segment_type: str  # 'hook', 'core', 'cta'
+    segment_type: str  # HOOK, CORE or CTA
     text: str
     display_lines: List[str]  # Lines to display on screen
+    # Filled in by Translator.translate_segments
+    caption_text: Optional[str] = None
+    caption_lines: Optional[List[str]] = None
+    translated_text: Optional[str] = None
+    translated_lines: Optional[List[str]] = None
 
 
 def parse_script(script_text: str) -> List[ScriptSegment]:
@@ -28,47 +49,63 @@ def parse_script(script_text: str) -> List[ScriptSegment]:
     
     End (CTA):
     <call to action>
+    
+    Parsed results are cached by script text (the same script is parsed
+    once per language); each call still gets its own ScriptSegment objects,
+    since callers annotate them.
     """
+    return [
+        ScriptSegment(segment_type=segment_type, text=text, display_lines=list(display_lines))
+        for segment_type, text, display_lines in _parse_sections(script_text)
+    ]
+
+
+@lru_cache(maxsize=64)
+def _parse_sections(script_text: str) -> Tuple[Tuple[str, str, Tuple[str, ...]], ...]:
+    """parse_script's work, as immutable (type, text, display_lines) tuples"""
     segments = []
     
-    # Normalize line endings
-    script_text = script_text.replace('\r\n', '\n')
+    # Walk the lines once; a line starting with Hook/Core/End opens a new
+    # section (the first line always belongs to the first one)
+    section_lines = []
+    for line in script_text.replace('\r\n', '\n').split('\n'):
+        if section_lines and _SECTION_START_RE.match(line):
+            _add_segment(segments, section_lines)
+            section_lines = []
+        section_lines.append(line)
+    _add_segment(segments, section_lines)
+    
+    return tuple(segments)
+
+
+def _add_segment(segments: list, section_lines: List[str]):
+    """Turn one section's lines into a segment tuple, if it has content"""
+    section = '\n'.join(section_lines).strip()
+    if not section:
+        return
     
-    # Split into sections
-    sections = re.split(r'\n(?=Hook|Core|End)', script_text, flags=re.IGNORECASE)
+    # Determine section type
+    head = section[:4].lower()
+    if head == 'hook':
+        segment_type = HOOK
+    elif head == 'core':
+        segment_type = CORE
+    elif head.startswith('end'):
+        segment_type = CTA
+    else:
+        segment_type = None
     
-    for section in sections:
-        section = section.strip()
-        if not section:
-            continue
-            
-        # Determine section type
-        if section.lower().startswith('hook'):
-            segment_type = 'hook'
-            # Remove the header line
-            content = re.sub(r'^Hook.*?:\s*\n?', '', section, flags=re.IGNORECASE).strip()
-        elif section.lower().startswith('core'):
-            segment_type = 'core'
-            content = re.sub(r'^Core.*?:\s*\n?', '', section, flags=re.IGNORECASE).strip()
-        elif section.lower().startswith('end'):
-            segment_type = 'cta'
-            content = re.sub(r'^End.*?:\s*\n?', '', section, flags=re.IGNORECASE).strip()
-        else:
-            # Default to core content
-            segment_type = 'core'
-            content = section
-        
-        if content:
-            # Split content into display lines (sentences or short phrases)
-            display_lines = split_into_display_lines(content)
-            
-            segments.append(ScriptSegment(
-                segment_type=segment_type,
-                text=content,
-                display_lines=display_lines
-            ))
+    if segment_type:
+        # Remove the header line
+        content = _HEADER_RE.sub('', section, count=1).strip()
+    else:
+        # Default to core content
+        segment_type = CORE
+        content = section
     
-    return segments
+    if content:
+        # Split content into display lines (sentences or short phrases)
+        segments.append((segment_type, content, tuple(split_into_display_lines(content))))
 
 
 def split_into_display_lines(text: str) -> List[str]:
@@ -78,27 +115,20 @@ def split_into_display_lines(text: str) -> List[str]:
     """
     lines = []
     
-    # First split by double newlines (paragraphs)
-    paragraphs = text.split('\n\n')
-    
-    for para in paragraphs:
-        # Split by single newlines
-        para_lines = para.split('\n')
+    # Paragraph breaks are just empty lines, so one split covers both
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
         
-        for line in para_lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # If line is too long, split by sentences
-            if len(line) > 50:
-                sentences = re.split(r'(?<=[.!?])\s+', line)
-                for sentence in sentences:
-                    sentence = sentence.strip()
-                    if sentence:
-                        lines.append(sentence)
-            else:
-                lines.append(line)
+        # If line is too long, split by sentences
+        if len(line) > 50:
+            for sentence in _SENTENCE_SPLIT_RE.split(line):
+                sentence = sentence.strip()
+                if sentence:
+                    lines.append(sentence)
+        else:
+            lines.append(line)
     
     return lines
 
@@ -0,0 +1,99 @@
+"""
+Check the line-oriented script parser against the original regex-split one
+"""
+
+import re
+
+import pytest
+
+from script_parser import parse_script, split_into_display_lines
+
+
+def reference_parse_script(script_text):
+    """The original parser: regex-split sections, then strip each header"""
+    segments = []
+    script_text = script_text.replace('\r\n', '\n')
+
+    for section in re.split(r'\n(?=Hook|Core|End)', script_text, flags=re.IGNORECASE):
+        section = section.strip()
+        if not section:
+            continue
+
+        lowered = section.lower()
+        if lowered.startswith('hook'):
+            segment_type = 'hook'
+            content = re.sub(r'^Hook.*?:\s*\n?', '', section, flags=re.IGNORECASE).strip()
+        elif lowered.startswith('core'):
+            segment_type = 'core'
+            content = re.sub(r'^Core.*?:\s*\n?', '', section, flags=re.IGNORECASE).strip()
+        elif lowered.startswith('end'):
+            segment_type = 'cta'
+            content = re.sub(r'^End.*?:\s*\n?', '', section, flags=re.IGNORECASE).strip()
+        else:
+            segment_type = 'core'
+            content = section
+
+        if content:
+            segments.append((segment_type, content, reference_split_into_display_lines(content)))
+
+    return segments
+
+
+def reference_split_into_display_lines(text):
+    """The original display-line split: paragraphs, then lines, then sentences"""
+    lines = []
+    for para in text.split('\n\n'):
+        for line in para.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            if len(line) > 50:
+                for sentence in re.split(r'(?<=[.!?])\s+', line):
+                    sentence = sentence.strip()
+                    if sentence:
+                        lines.append(sentence)
+            else:
+                lines.append(line)
+    return lines
+
+
+SCRIPTS = [
+    # The sample script from script_parser's __main__ block
+    """Hook (0–2s):
+Here's how to unfuck your life—no motivation required.
+
+Core:
+Fix your sleep.
+Fix your diet.
+Fix your room.
+
+You don't need a new mindset.
+You need basic discipline.
+
+Chaos outside
+creates chaos inside.
+
+End (CTA):
+Follow for more raw truth.""",
+    # Windows line endings, lowercase headers, header text on the same line
+    "hook: Stop scrolling.\r\n\r\ncore (3-20s):\r\nOne. Two. Three.\r\nend:\r\nSubscribe.\r\n",
+    # Text before the first header defaults to core; empty sections are dropped
+    "Intro line with no header.\nHook:\n\nCore:\nThe actual content.\n\n\nEnd (CTA):\n",
+    # Long lines get split on sentence breaks, short ones are kept whole
+    "Core:\nThis line is definitely longer than fifty characters. It has two sentences! And a third?\nShort line.",
+    # Header words mid-line don't start a section
+    "Hook:\nThe Core idea is simple.\nEnding soon.\nCore:\n  indented text  \n\t\nEnd",
+    "",
+    "\n\n  \n",
+]
+
+
+@pytest.mark.parametrize("script", SCRIPTS)
+def test_parse_script_matches_reference(script):
+    parsed = [(s.segment_type, s.text, s.display_lines) for s in parse_script(script)]
+    assert parsed == reference_parse_script(script)
+
+
+@pytest.mark.parametrize("script", SCRIPTS)
+def test_split_into_display_lines_matches_reference(script):
+    assert split_into_display_lines(script) == reference_split_into_display_lines(script)
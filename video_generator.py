@@ -4,9 +4,16 @@ Video Generator with stock videos/animations and full-screen captions
 
 import os
 import sys
+import json
 import random
+import hashlib
 import signal
+import shutil
+import tempfile
 import textwrap
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Optional
 
@@ -43,6 +50,7 @@ from moviepy.editor import (
     vfx,
 )
 from moviepy.audio.fx.all import audio_loop
+from moviepy.video.io import ffmpeg_writer
 
 from config import (
     VIDEO_WIDTH, VIDEO_HEIGHT, FPS,
@@ -57,8 +65,161 @@ from anime_video_fetcher import AnimeVideoFetcher
 from multi_source_fetcher import MultiSourceFetcher
 
 
+# H.264 encoders in order of preference: GPU/media-engine encoders first, then software
+HW_ENCODERS = ("h264_nvenc", "h264_qsv", "h264_videotoolbox")
+SOFTWARE_ENCODER = "libx264"
+
+# Per-encoder write options: (preset, bitrate, extra ffmpeg params). None leaves
+# the flag off: h264_videotoolbox has no presets, and NVENC is rate-controlled
+# by its -cq quality target alone
+ENCODER_OPTIONS = {
+    "libx264": ("ultrafast", "4000k", ["-tune", "fastdecode"]),
+    "h264_nvenc": ("p4", None, ["-tune", "hq", "-rc", "vbr", "-cq", "23", "-pix_fmt", "yuv420p"]),
+    "h264_qsv": ("veryfast", "4000k", ["-pix_fmt", "nv12"]),
+    "h264_videotoolbox": (None, "4000k", ["-pix_fmt", "yuv420p"]),
+}
+
+# Hardware probe results, shared by every process (publish_all runs one per language)
+ENCODER_CACHE_FILE = Path(tempfile.gettempdir()) / "videogen_encoder_cache.json"
+
+
+class _VideoWriter(ffmpeg_writer.FFMPEG_VideoWriter):
+    """MoviePy's ffmpeg writer, but `-preset`/`-b` are only passed when set.
+
+    MoviePy 1.0.3 always emits `-preset <preset>`, which encoders without
+    presets (h264_videotoolbox) reject as an unused option.
+    """
+
+    def __init__(self, filename, size, fps, codec="libx264", audiofile=None,
+                 preset="medium", bitrate=None, withmask=False,
+                 logfile=None, threads=None, ffmpeg_params=None):
+        if logfile is None:
+            logfile = subprocess.PIPE
+        
+        self.filename = filename
+        self.codec = codec
+        self.ext = filename.split(".")[-1]
+        
+        cmd = [
+            _ffmpeg_binary(), "-y",
+            "-loglevel", "error" if logfile == subprocess.PIPE else "info",
+            "-f", "rawvideo", "-vcodec", "rawvideo",
+            "-s", "%dx%d" % (size[0], size[1]),
+            "-pix_fmt", "rgba" if withmask else "rgb24",
+            "-r", "%.02f" % fps,
+            "-an", "-i", "-",
+        ]
+        if audiofile is not None:
+            cmd += ["-i", audiofile, "-acodec", "copy"]
+        cmd += ["-vcodec", codec]
+        if preset is not None:
+            cmd += ["-preset", preset]
+        cmd += ffmpeg_params or []
+        if bitrate is not None:
+            cmd += ["-b:v", bitrate]
+        if threads is not None:
+            cmd += ["-threads", str(threads)]
+        if codec == "libx264" and size[0] % 2 == 0 and size[1] % 2 == 0:
+            cmd += ["-pix_fmt", "yuv420p"]
+        cmd.append(filename)
+        
+        popen_params = {"stdout": subprocess.DEVNULL, "stderr": logfile, "stdin": subprocess.PIPE}
+        if os.name == "nt":
+            popen_params["creationflags"] = 0x08000000  # CREATE_NO_WINDOW
+        self.proc = subprocess.Popen(cmd, **popen_params)
+
+
+# ffmpeg_write_video looks the writer class up at call time
+ffmpeg_writer.FFMPEG_VideoWriter = _VideoWriter
+
+
+def _ffmpeg_binary() -> str:
+    """The ffmpeg executable MoviePy encodes with"""
+    try:
+        from moviepy.config import get_setting
+        return get_setting("FFMPEG_BINARY")
+    except Exception:
+        return "ffmpeg"
+
+
+def _encoder_cache_key(ffmpeg: str) -> Optional[str]:
+    """Identify the ffmpeg build, so a swapped binary gets probed again"""
+    path = shutil.which(ffmpeg) or ffmpeg
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{os.path.realpath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+@lru_cache(maxsize=None)
+def detect_available_encoders() -> frozenset:
+    """Hardware H.264 encoders that ffmpeg was built with AND can actually open here.
+
+    `ffmpeg -encoders` only lists what was compiled in (NVENC shows up on
+    machines without an NVIDIA GPU), so each candidate is confirmed with a
+    one-frame test encode. The result is cached on disk per ffmpeg binary, so
+    the probe runs once per machine rather than once per process.
+    """
+    ffmpeg = _ffmpeg_binary()
+    cache_key = _encoder_cache_key(ffmpeg)
+    try:
+        cached = json.loads(ENCODER_CACHE_FILE.read_text())
+        if cache_key and cached.get("ffmpeg") == cache_key:
+            return frozenset(cached["encoders"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    
+    try:
+        listing = subprocess.run(
+            [ffmpeg, "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10,
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return frozenset()
+    
+    available = set()
+    for encoder in HW_ENCODERS:
+        if f" {encoder} " not in listing:
+            continue
+        try:
+            probe = subprocess.run(
+                [ffmpeg, "-hide_banner", "-loglevel", "error",
+                 "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+                 "-frames:v", "1", "-c:v", encoder, "-f", "null", "-"],
+                capture_output=True, timeout=15,
+            )
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if probe.returncode == 0:
+            available.add(encoder)
+    
+    if cache_key:
+        try:
+            tmp = ENCODER_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"ffmpeg": cache_key, "encoders": sorted(available)}))
+            os.replace(tmp, ENCODER_CACHE_FILE)
+        except OSError:
+            pass
+    return frozenset(available)
+
+
+def select_video_encoder(preferred: Optional[str] = None) -> str:
+    """Pick the H.264 encoder: an explicit choice, else the fastest working one"""
+    if preferred and preferred != "auto":
+        if preferred != SOFTWARE_ENCODER and preferred not in detect_available_encoders():
+            safe_print(f"   ⚠ Encoder {preferred} not usable here, falling back to {SOFTWARE_ENCODER}")
+            return SOFTWARE_ENCODER
+        return preferred
+    available = detect_available_encoders()
+    for encoder in HW_ENCODERS:
+        if encoder in available:
+            return encoder
+    return SOFTWARE_ENCODER
+
+
 class VideoGenerator:
-    def __init__(self, pexels_api_key: Optional[str] = None):
+    def __init__(self, pexels_api_key: Optional[str] = None, encoder: Optional[str] = None):
         self.temp_dir = Path(TEMP_DIR)
         self.output_dir = Path(OUTPUT_DIR)
         self.temp_dir.mkdir(exist_ok=True)
@@ -70,6 +231,11 @@ class VideoGenerator:
         self.bg_generator = AnimatedBackgroundGenerator()
         self.audio_generator = AudioGenerator()
         self.font_path = self._get_font_path()
+        # Optional dict-like {sha256(script|language): translated_text}, shared by callers
+        self.translation_cache = None
+        # H.264 encoder for the final render ("auto"/None picks hardware when available)
+        self.codec = select_video_encoder(encoder)
+        safe_print(f"   Video encoder: {self.codec}")
     
     def _get_font_path(self) -> str:
         """Get a suitable bold font path"""
@@ -296,12 +462,115 @@ class VideoGenerator:
         print("YOUTUBE SHORTS VIDEO GENERATOR")
         print("=" * 50)
         
+        # Background clip downloads only depend on the script, so start them now
+        # and let them run while translation and TTS are in flight (step 4 waits)
+        background_source = None
+        if not any(os.path.exists(path) for path in custom_gif_paths or []):
+            background_source = self._select_background_source(
+                use_anime_clips, use_giphy_clips, use_pixabay_clips, use_stock_videos
+            )
+        prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        background_future = None
+        if background_source:
+            background_future = prefetch_pool.submit(
+                self._fetch_background_videos, background_source, segments, stock_keywords
+            )
+        try:
+            return self._generate_video(
+                segments, output_filename, use_stock_videos, stock_keywords,
+                target_language, report_progress, use_anime_clips, use_giphy_clips,
+                use_pixabay_clips, custom_gif_paths, custom_soundtrack_path,
+                soundtrack_volume, background_future,
+            )
+        finally:
+            # On error/cancel, drop the download if it hasn't started; if it
+            # has, wait it out. The generator is reused across jobs, and a
+            # stray download would keep writing to TEMP_DIR and downloaded_urls
+            # under the next job's cleanup/reset
+            if background_future is not None:
+                background_future.cancel()
+            prefetch_pool.shutdown(wait=True)
+    
+    def _select_background_source(
+        self,
+        use_anime_clips: bool,
+        use_giphy_clips: bool,
+        use_pixabay_clips: bool,
+        use_stock_videos: bool,
+    ) -> Optional[str]:
+        """Which downloaded background source generate_video will use, if any"""
+        if use_anime_clips:
+            return "anime"
+        if use_giphy_clips:
+            return "giphy"
+        if use_pixabay_clips:
+            return "pixabay"
+        if use_stock_videos and self.stock_fetcher.api_key:
+            return "stock"
+        return None
+    
+    def _fetch_background_videos(
+        self,
+        source: str,
+        segments: List[ScriptSegment],
+        stock_keywords: Optional[List[str]],
+    ) -> List[str]:
+        """Download background clips for source; safe to run on a worker thread"""
+        keywords = stock_keywords[:3] if stock_keywords else None
+        if source == "anime":
+            return self.anime_fetcher.fetch_anime_clips(count=3, keywords=keywords)
+        if source == "giphy":
+            return self.multi_fetcher.fetch_hand_drawn_gifs(
+                query=keywords[0] if keywords else None,
+                count=3
+            )
+        if source == "pixabay":
+            return self.multi_fetcher.fetch_from_pixabay(
+                query=keywords[0] if keywords else "motivation",
+                media_type="video",
+                count=3
+            )
+        # Use custom keywords if provided, otherwise extract from script
+        if not keywords:
+            keywords = self.stock_fetcher.get_keywords_from_script(segments)
+        return self.stock_fetcher.fetch_videos(keywords=keywords, count=3)
+    
+    def _generate_video(
+        self,
+        segments: List[ScriptSegment],
+        output_filename: str,
+        use_stock_videos: bool,
+        stock_keywords: Optional[List[str]],
+        target_language: str,
+        report_progress,
+        use_anime_clips: bool,
+        use_giphy_clips: bool,
+        use_pixabay_clips: bool,
+        custom_gif_paths: Optional[List[str]],
+        custom_soundtrack_path: Optional[str],
+        soundtrack_volume: float,
+        background_future,
+    ) -> str:
+        """generate_video body; background_future holds prefetched clip paths (or None)"""
         # Step 1: Translate text (0% -> 10%)
         report_progress(0.02, "Translating script...")
         full_text = get_full_narration_text(segments)
         
-        translator = Translator(target_language)
-        translated_text = translator.translate(full_text)
+        translated_text = None
+        cache_key = None
+        if self.translation_cache is not None:
+            cache_key = hashlib.sha256(
+                f"{full_text.strip()}|{target_language}".encode("utf-8")
+            ).hexdigest()
+            translated_text = self.translation_cache.get(cache_key)
+        if translated_text is None:
+            translator = Translator(target_language)
+            translated_text = translator.translate(full_text)
+            # Don't cache failures (translate() falls back to the original text)
+            if cache_key and (translated_text != full_text or translator.target_language.startswith("en")):
+                self.translation_cache[cache_key] = translated_text
+        else:
+            print("      Using cached translation")
         if target_language != "en" and not target_language.startswith("en"):
             report_progress(0.08, f"Translated to {target_language}")
         else:
@@ -366,102 +635,54 @@ class VideoGenerator:
             except Exception as e:
                 print(f"      Error processing custom GIFs: {e}")
         
-        # Try anime clips if requested
-        if not background_clips and use_anime_clips:
-            # Use stock_keywords for anime search if provided
-            anime_keywords = stock_keywords[:3] if stock_keywords else None
-            if anime_keywords:
-                report_progress(0.35, f"Fetching anime clips for: {', '.join(anime_keywords)}...")
-            else:
-                report_progress(0.35, "Fetching random anime clips from Trace Moe...")
-            video_paths = self.anime_fetcher.fetch_anime_clips(count=3, keywords=anime_keywords)
-            
-            if video_paths:
-                report_progress(0.45, f"Processing {len(video_paths)} anime clips...")
-                for i, vpath in enumerate(video_paths):
-                    try:
-                        clip = VideoFileClip(vpath)
-                        clip = self.resize_video_to_fullscreen(clip)
-                        clip = clip.fx(vfx.colorx, 0.6)  # Slightly less dim for anime
-                        background_clips.append(clip)
-                        report_progress(0.45 + (i+1)*0.03, f"Processed anime clip {i+1}/{len(video_paths)}")
-                    except Exception as e:
-                        print(f"      Error loading anime clip: {e}")
-        
-        # Try GIPHY animated GIFs
-        elif not background_clips and use_giphy_clips:
-            giphy_keywords = stock_keywords[:3] if stock_keywords else None
-            if giphy_keywords:
-                report_progress(0.35, f"Fetching GIPHY GIFs for: {', '.join(giphy_keywords)}...")
-            else:
-                report_progress(0.35, "Fetching animated GIFs from GIPHY...")
-            
-            video_paths = self.multi_fetcher.fetch_hand_drawn_gifs(
-                query=giphy_keywords[0] if giphy_keywords else None,
-                count=3
-            )
-            
-            if video_paths:
-                report_progress(0.45, f"Processing {len(video_paths)} GIPHY clips...")
-                for i, vpath in enumerate(video_paths):
-                    try:
-                        clip = VideoFileClip(vpath)
-                        clip = self.resize_video_to_fullscreen(clip)
-                        clip = clip.fx(vfx.colorx, 0.7)  # Keep GIFs brighter
-                        background_clips.append(clip)
-                        report_progress(0.45 + (i+1)*0.03, f"Processed GIPHY clip {i+1}/{len(video_paths)}")
-                    except Exception as e:
-                        print(f"      Error loading GIPHY clip: {e}")
-        
-        # Try Pixabay free videos
-        elif not background_clips and use_pixabay_clips:
-            pixabay_keywords = stock_keywords[:3] if stock_keywords else None
-            if pixabay_keywords:
-                report_progress(0.35, f"Fetching Pixabay videos for: {', '.join(pixabay_keywords)}...")
-            else:
-                report_progress(0.35, "Fetching free videos from Pixabay...")
-            
-            video_paths = self.multi_fetcher.fetch_from_pixabay(
-                query=pixabay_keywords[0] if pixabay_keywords else "motivation",
-                media_type="video",
-                count=3
+        # Downloaded clips (anime / GIPHY / Pixabay / Pexels stock)
+        if not background_clips:
+            source = self._select_background_source(
+                use_anime_clips, use_giphy_clips, use_pixabay_clips, use_stock_videos
             )
-            
-            if video_paths:
-                report_progress(0.45, f"Processing {len(video_paths)} Pixabay clips...")
-                for i, vpath in enumerate(video_paths):
-                    try:
-                        clip = VideoFileClip(vpath)
-                        clip = self.resize_video_to_fullscreen(clip)
-                        clip = clip.fx(vfx.colorx, 0.65)  # Slightly dim
-                        background_clips.append(clip)
-                        report_progress(0.45 + (i+1)*0.03, f"Processed Pixabay clip {i+1}/{len(video_paths)}")
-                    except Exception as e:
-                        print(f"      Error loading Pixabay clip: {e}")
-        
-        # Try to fetch stock videos if not using anime/sketch or they failed
-        elif not background_clips and use_stock_videos and self.stock_fetcher.api_key:
-            report_progress(0.35, "Searching Pexels for stock videos...")
-            # Use custom keywords if provided, otherwise extract from script
-            if stock_keywords:
-                keywords = stock_keywords[:3]  # Limit to 3 keywords
-            else:
-                keywords = self.stock_fetcher.get_keywords_from_script(segments)
-            
-            report_progress(0.38, f"Downloading videos for: {', '.join(keywords[:2])}...")
-            video_paths = self.stock_fetcher.fetch_videos(keywords=keywords, count=3)
-            
-            if video_paths:
-                report_progress(0.45, f"Processing {len(video_paths)} stock videos...")
-                for i, vpath in enumerate(video_paths):
-                    try:
-                        clip = VideoFileClip(vpath)
-                        clip = self.resize_video_to_fullscreen(clip)
-                        clip = clip.fx(vfx.colorx, 0.5)
-                        background_clips.append(clip)
-                        report_progress(0.45 + (i+1)*0.03, f"Processed video {i+1}/{len(video_paths)}")
-                    except Exception as e:
-                        print(f"      Error loading video: {e}")
+            if source:
+                keywords = stock_keywords[:3] if stock_keywords else None
+                fetch_msg, label, processing_label, brightness = {
+                    "anime": (
+                        f"Fetching anime clips for: {', '.join(keywords)}..." if keywords
+                        else "Fetching random anime clips from Trace Moe...",
+                        "anime clip", "anime clips", 0.6,  # Slightly less dim for anime
+                    ),
+                    "giphy": (
+                        f"Fetching GIPHY GIFs for: {', '.join(keywords)}..." if keywords
+                        else "Fetching animated GIFs from GIPHY...",
+                        "GIPHY clip", "GIPHY clips", 0.7,  # Keep GIFs brighter
+                    ),
+                    "pixabay": (
+                        f"Fetching Pixabay videos for: {', '.join(keywords)}..." if keywords
+                        else "Fetching free videos from Pixabay...",
+                        "Pixabay clip", "Pixabay clips", 0.65,  # Slightly dim
+                    ),
+                    "stock": (
+                        "Searching Pexels for stock videos...",
+                        "video", "stock videos", 0.5,
+                    ),
+                }[source]
+                report_progress(0.35, fetch_msg)
+                
+                # Normally prefetched during translation/TTS; custom GIFs that
+                # all failed to load fall through to a download here
+                if background_future is not None:
+                    video_paths = background_future.result()
+                else:
+                    video_paths = self._fetch_background_videos(source, segments, stock_keywords)
+                
+                if video_paths:
+                    report_progress(0.45, f"Processing {len(video_paths)} {processing_label}...")
+                    for i, vpath in enumerate(video_paths):
+                        try:
+                            clip = VideoFileClip(vpath)
+                            clip = self.resize_video_to_fullscreen(clip)
+                            clip = clip.fx(vfx.colorx, brightness)
+                            background_clips.append(clip)
+                            report_progress(0.45 + (i+1)*0.03, f"Processed {label} {i+1}/{len(video_paths)}")
+                        except Exception as e:
+                            print(f"      Error loading {label}: {e}")
         
         # Fallback to animated backgrounds if no stock videos
         if not background_clips:
@@ -677,18 +898,19 @@ class VideoGenerator:
         # Explicit temp audio file path to avoid Windows TEMP_MPY lock issues
         temp_audiofile = output_path.replace('.mp4', '_temp_audio.mp4')
         
+        preset, bitrate, codec_params = ENCODER_OPTIONS.get(self.codec, ENCODER_OPTIONS[SOFTWARE_ENCODER])
         final_video.write_videofile(
             temp_output,
             fps=FPS,
-            codec='libx264',
+            codec=self.codec,
             audio_codec='aac',
-            bitrate='4000k',
+            bitrate=bitrate,
             audio_bitrate='128k',
             threads=os.cpu_count() or 4,
-            preset='ultrafast',
+            preset=preset,
             temp_audiofile=temp_audiofile,
             remove_temp=True,
-            ffmpeg_params=['-movflags', '+faststart', '-tune', 'fastdecode'],
+            ffmpeg_params=['-movflags', '+faststart', *codec_params],
             verbose=False,
             logger=encoding_logger
         )